@@ -49,6 +49,10 @@ class FilterOperator(str, Enum):
         return str(self)
 
 
+# the only operations valid on 'ip' and 'enum' Filter Fields
+_EQUALITY_OPERATORS = frozenset((FilterOperator.EQ, FilterOperator.NEQ))
+
+
 class FieldType(str, Enum):
     """Enumerates the valid types for a FilterField."""
 
@@ -362,12 +366,12 @@ class FilterField:
                 # all operations are valid for all number Fields
                 pass
             case FieldType.IP:
-                if operation not in [FilterOperator.EQ, FilterOperator.NEQ]:
+                if operation not in _EQUALITY_OPERATORS:
                     raise FilterFieldOperationValueError(
                         f"'{operation}' is not a valid operation to filter with for an 'ip' Filter Field."
                     )
             case FieldType.ENUM:
-                if operation not in [FilterOperator.EQ, FilterOperator.NEQ]:
+                if operation not in _EQUALITY_OPERATORS:
                     raise FilterFieldOperationValueError(
                         f"'{operation}' is not a valid operation to filter with for an 'enum' Filter Field."
                     )
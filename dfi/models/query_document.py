@@ -45,6 +45,7 @@ class QueryDocument:
         self._filter_fields: list[FilterField] | None = None
 
         self._document: dict[str, Any] = {"filters": {}}
+        # each setter validates its own input, so no trailing validate() is needed here
         self.set_dataset_id(dataset_id)
         self.set_return_model(return_model)
         self.set_uids(uids)
@@ -53,8 +54,6 @@ class QueryDocument:
         self.set_only(only)
         self.set_filter_fields(filter_fields)
 
-        self.validate()
-
     def __repr__(self) -> str:
         """Class representation."""
         return f"""QueryDocument(
@@ -0,0 +1,151 @@
+"""Incremental decoder for Server-Sent Event streams returned by the DFI API."""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+_EVENT_SEPARATOR = b"\n\n"
+_FIELD_SEPARATOR = b":"
+
+
+@dataclass(slots=True)
+class Event:
+    """A dispatched Server-Sent Event."""
+
+    event: str = "message"
+    data: str = ""
+    id: str | None = None
+    retry: str | None = None
+
+
+class SSEDecoder:
+    """Split byte chunks of any size into Server-Sent Events.
+
+    Chunks are appended to a single buffer and only the unscanned tail is searched for an
+    event boundary, so the parsing work stays linear in the size of the stream however
+    the HTTP response is chunked.
+
+    Parameters
+    ----------
+    encoding:
+        Character encoding of the stream.
+    """
+
+    def __init__(self, encoding: str = "utf-8") -> None:
+        """Initialize an empty decoder."""
+        self._encoding = encoding
+        self._buffer = bytearray()
+        self._scan_start = 0
+        self._pending_cr = False
+
+    def feed(self, chunk: bytes) -> list[Event]:
+        """Add a chunk to the buffer and return the events it completes.
+
+        Parameters
+        ----------
+        chunk:
+            Raw bytes read from the stream.
+
+        Returns
+        -------
+        list[Event]
+            Events terminated by a blank line within the buffered stream.
+        """
+        if self._pending_cr:
+            chunk = b"\r" + chunk
+            self._pending_cr = False
+        if chunk.endswith(b"\r"):
+            # a trailing CR may be the first half of a CRLF split across chunks
+            chunk = chunk[:-1]
+            self._pending_cr = True
+        self._buffer += chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        events = []
+        start = 0
+        while (end := self._buffer.find(_EVENT_SEPARATOR, max(start, self._scan_start))) != -1:
+            if (event := self._parse(self._buffer[start:end])) is not None:
+                events.append(event)
+            start = end + len(_EVENT_SEPARATOR)
+
+        del self._buffer[:start]
+        self._scan_start = max(len(self._buffer) - 1, 0)
+
+        return events
+
+    def flush(self) -> list[Event]:
+        """Return the event left in the buffer by a stream that did not end with a blank line.
+
+        Returns
+        -------
+        list[Event]
+            The trailing event, if there is one.
+        """
+        block = bytes(self._buffer)
+        self._buffer.clear()
+        self._scan_start = 0
+        self._pending_cr = False
+
+        event = self._parse(block)
+        return [] if event is None else [event]
+
+    def _parse(self, block: bytes | bytearray) -> Event | None:
+        """Parse the lines of a single event, returning None if it carries no data.
+
+        Parameters
+        ----------
+        block:
+            The lines of one event, without the blank line terminating it.
+        """
+        event = Event()
+        data_lines = []
+
+        for line in block.split(b"\n"):
+            # blank lines and lines starting with a colon (comments) are ignored
+            if not line.strip() or line.startswith(_FIELD_SEPARATOR):
+                continue
+
+            field, _, value = line.partition(_FIELD_SEPARATOR)
+            if value.startswith(b" "):
+                value = value[1:]
+
+            match field:
+                case b"data":
+                    data_lines.append(value)
+                case b"event":
+                    event.event = value.decode(self._encoding)
+                case b"id":
+                    event.id = value.decode(self._encoding)
+                case b"retry":
+                    event.retry = value.decode(self._encoding)
+                case _:
+                    continue
+
+        if not data_lines:
+            return None
+
+        event.data = b"\n".join(data_lines).decode(self._encoding)
+        event.event = event.event or "message"
+        return event
+
+
+class SSEStream:
+    """Iterate the Server-Sent Events carried by a stream of byte chunks.
+
+    Parameters
+    ----------
+    chunks:
+        Raw byte chunks, e.g. from `requests.Response.iter_content`.
+    encoding:
+        Character encoding of the stream.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str = "utf-8") -> None:
+        """Wrap an iterable of byte chunks."""
+        self._chunks = chunks
+        self._encoding = encoding
+
+    def events(self) -> Iterator[Event]:
+        """Yield each event in the stream as soon as its terminating blank line is received."""
+        decoder = SSEDecoder(self._encoding)
+        for chunk in self._chunks:
+            yield from decoder.feed(chunk)
+        yield from decoder.flush()
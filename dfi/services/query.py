@@ -2,10 +2,13 @@
 
 import json  # noqa: I001
 import logging
-from typing import Any
+import warnings
+from collections.abc import Iterator
+from typing import Any, cast
 
+import numpy as np
 import pandas as pd
-from sseclient import SSEClient
+import pyarrow as pa
 from tqdm import tqdm
 
 from dfi.connect import Connect
@@ -23,9 +26,112 @@ from dfi.models import QueryDocument
 from dfi.models.filters import FilterField, Only, TimeRange
 from dfi.models.filters.geometry import BBox, Polygon
 from dfi.models.returns import Count, GroupBy, IncludeField, Records
+from dfi.services._sse import SSEStream
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads  # type: ignore[assignment]
 
 _logger = logging.getLogger(__name__)
 
+_CHUNK_SIZE = 64 * 1024
+
+# record ids and coordinates are held in Arrow buffers rather than as Python objects
+_ID_DTYPE = pd.StringDtype("pyarrow")
+_COORDINATE_DTYPE = pd.ArrowDtype(pa.list_(pa.float64()))
+
+
+def _parse_times(times: list[str | None]) -> pd.DatetimeIndex:
+    """Parse ISO 8601 timestamps into a UTC DatetimeIndex.
+
+    The DFI API returns UTC times with a `Z` suffix, which NumPy parses in a single vectorized pass once the
+    suffix is dropped.  Anything NumPy rejects, e.g. an explicit offset or a missing time, falls back to
+    `pd.to_datetime`, which parses missing times as NaT.
+
+    Parameters
+    ----------
+    times:
+        ISO 8601 formatted timestamps, or None where a record has no time.
+    """
+    if None in times:
+        return pd.to_datetime(times, utc=True, format="ISO8601")
+
+    try:
+        with warnings.catch_warnings():
+            # NumPy only warns when parsing offsets, so make that a failure too
+            warnings.simplefilter("error", DeprecationWarning)
+            parsed = np.array(
+                [time.removesuffix("Z") for time in cast(list[str], times)],
+                dtype="datetime64[ns]",
+            )
+    except (ValueError, DeprecationWarning):
+        return pd.to_datetime(times, utc=True, format="ISO8601")
+
+    return pd.DatetimeIndex(parsed).tz_localize("UTC")
+
+
+def _id_array(ids: list[Any]) -> pd.api.extensions.ExtensionArray | list[Any]:
+    """Store record ids in an Arrow-backed array of their own type.
+
+    Ids may be strings or integers.  Strings use pandas' Arrow string dtype and other types are inferred by
+    pyarrow.  Ids pyarrow cannot hold, a mix of types or integers beyond int64, are left as a list for pandas
+    to infer, becoming an object or uint64 column.
+
+    Parameters
+    ----------
+    ids:
+        The id of each record.
+    """
+    if all(isinstance(uid, str) for uid in ids):
+        return pd.array(ids, dtype=_ID_DTYPE)
+
+    try:
+        return pd.arrays.ArrowExtensionArray(pa.array(ids))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return ids
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    """Check that a chunk_size is a positive integer.
+
+    Parameters
+    ----------
+    chunk_size:
+        The maximum number of records in each DataFrame.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}.")
+
+
+def _records_frame(columns: dict[str, list[Any]], n_records: int) -> pd.DataFrame:
+    """Build a records DataFrame from column-wise lists.
+
+    Parameters
+    ----------
+    columns:
+        Values of each field, in record order.  Columns shorter than `n_records` are missing trailing values.
+    n_records:
+        The number of records collected.
+    """
+    if n_records == 0:
+        return pd.DataFrame(
+            {
+                "id": pd.array([], dtype=_ID_DTYPE),
+                "coordinate": pd.array([], dtype=_COORDINATE_DTYPE),
+                "time": pd.DatetimeIndex([], tz="UTC"),
+            }
+        )
+
+    for key in ("id", "coordinate", "time"):
+        columns.setdefault(key, [])
+    for column in columns.values():
+        column.extend([None] * (n_records - len(column)))
+    columns["id"] = _id_array(columns["id"])
+    columns["coordinate"] = pd.array(columns["coordinate"], dtype=_COORDINATE_DTYPE)
+    columns["time"] = _parse_times(columns["time"])
+    return pd.DataFrame(columns)
+
 
 class Query:
     """Class responsible for requests to the Query V1 DFI API.
@@ -320,7 +426,7 @@ class Query:
         self._document = query_doc.build()
 
         with self.conn.api_post("v1/query", json=self._document) as response:
-            client = SSEClient(response)  # type: ignore[arg-type]
+            client = SSEStream(response.iter_content(chunk_size=_CHUNK_SIZE))
             return self._receive_counts(client)
 
     def unique_id_counts(
@@ -409,7 +515,7 @@ class Query:
         self._document = query_doc.build()
 
         with self.conn.api_post("v1/query", json=self._document) as response:
-            client = SSEClient(response)  # type: ignore[arg-type]
+            client = SSEStream(response.iter_content(chunk_size=_CHUNK_SIZE))
             return self._receive_unique_id_counts(client)
 
     def records(
@@ -507,9 +613,92 @@ class Query:
         self._document = query_doc.build()
 
         with self.conn.api_post("v1/query", json=self._document) as response:
-            client = SSEClient(response)  # type: ignore[arg-type]
+            client = SSEStream(response.iter_content(chunk_size=_CHUNK_SIZE))
             return self._receive_records(client)
 
+    def records_chunked(  # noqa: PLR0913 (records filters plus chunk_size)
+        self,
+        dataset_id: str,
+        chunk_size: int,
+        uids: list[str | int] | None = None,
+        geometry: Polygon | BBox | None = None,
+        time_range: TimeRange | None = None,
+        only: Only | str | None = None,
+        filter_fields: list[FilterField] | None = None,
+        include: list[IncludeField | str] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Query for the records within the filter bounds, yielding them in DataFrames of at most `chunk_size` rows.
+
+        Only one chunk of records is held in memory at a time, so results too large to collect with
+        `records` can be processed incrementally.  The arguments are validated when this is called, but
+        the query is only sent when iteration starts and the response stays open until the last chunk
+        has been yielded.
+
+        ??? info "Endpoint"
+            [POST /v1/query](https://api.prod.generalsystem.com/docs/api#/Query%20(v1)/post_v1_query)
+
+        Parameters
+        ----------
+        dataset_id:
+            the dataset to be queried.
+        chunk_size:
+            the maximum number of records in each DataFrame.
+        uids:
+            specifies which uids to search for.
+        geometry:
+            specifies the spatial bounds to search within.
+        time_range:
+            specifies the time bounds to search within.
+        only:
+            specifies that only the newest or oldest record is retuned.
+        filter_fields:
+            specifies filters on Filter Fields.
+        include:
+            specifies the extra fields to include in the returned results.
+
+        Yields
+        ------
+        records
+            The records within the bounds, `chunk_size` at a time.  A field missing from every record of a
+            chunk is absent from that chunk's DataFrame.
+
+        Raises
+        ------
+        DFIResponseError
+        InvalidQueryDocument
+        TimeRangeUndefinedError
+        PolygonUndefinedError
+        BBoxUndefinedError
+        ValueError
+
+        Examples
+        --------
+        ```python
+        from dfi import Client
+
+        dfi = Client("<token>", "<url>")
+
+        dataset_id = "<dataset id>"
+
+        chunks = dfi.query.records_chunked(dataset_id, chunk_size=100_000)
+        for i, records in enumerate(chunks):
+            records.to_parquet(f"records-{i}.parquet")
+        ```
+        """
+        _check_chunk_size(chunk_size)
+        query_doc = QueryDocument(
+            dataset_id=dataset_id,
+            return_model=Records(include=include),
+            uids=uids,
+            time_range=time_range,
+            geometry=geometry,
+            only=only,
+            filter_fields=filter_fields,
+        )
+        self._document = query_doc.build()
+
+        return self._stream_records_chunked(self._document, chunk_size)
+
     def raw_request(self, document: dict[str, Any]) -> pd.DataFrame | list[str] | int:
         """Provide an escape hatch for those who definitely, absolutely, 100% know what they're doing.
 
@@ -527,7 +716,7 @@ class Query:
         self._document = document
 
         with self.conn.api_post("v1/query", json=document) as response:
-            client = SSEClient(response)  # type: ignore[arg-type]
+            client = SSEStream(response.iter_content(chunk_size=_CHUNK_SIZE))
             match document:
                 case {"return": {"type": "count", "groupBy": {"type": "uniqueId"}}}:
                     return self._receive_unique_id_counts(client)
@@ -539,7 +728,7 @@ class Query:
                     # This will only happen in DFI API adds new return types before dfipy is updated.
                     raise ValueError("Unknown return type.")
 
-    def _receive_counts(self, client: SSEClient) -> int:
+    def _receive_counts(self, client: SSEStream) -> int:
         """Collect 'count' results by summing the results received.
 
         Parameters
@@ -571,17 +760,18 @@ class Query:
         ):
             events_list_is_empty = False
 
+            # message events dominate a stream, so match them first
             match event.event:
-                case "keepAlive":
-                    continue
                 case "message":
                     messages_received += 1
-                    counts += json.loads(event.data)
+                    counts += _json_loads(event.data)
                     pbar.set_description(f"Collecting {counts:,} counts")
                     continue
+                case "keepAlive":
+                    continue
                 case "finish":
                     finish_message = True
-                    messages_sent = json.loads(event.data).get("messageCount")
+                    messages_sent = _json_loads(event.data).get("messageCount")
                     break
                 case "queryError":
                     raise DFIResponseError(event.data)
@@ -603,7 +793,7 @@ class Query:
 
         return counts
 
-    def _receive_unique_id_counts(self, client: SSEClient) -> dict[str | int, int]:
+    def _receive_unique_id_counts(self, client: SSEStream) -> dict[str | int, int]:
         """Collect 'uniqueIds groupBy' results.
 
         Parameters
@@ -634,19 +824,20 @@ class Query:
         ):
             events_list_is_empty = False
 
+            # message events dominate a stream, so match them first
             match event.event:
-                case "keepAlive":
-                    continue
                 case "message":
                     messages_received += 1
-                    unique_id_counts.update(json.loads(event.data))
+                    unique_id_counts.update(_json_loads(event.data))
                     pbar.set_description(
                         f"Collecting {len(unique_id_counts):,} id counts."
                     )
                     continue
+                case "keepAlive":
+                    continue
                 case "finish":
                     finish_message = True
-                    messages_sent = json.loads(event.data).get("messageCount")
+                    messages_sent = _json_loads(event.data).get("messageCount")
                     break
                 case "queryError":
                     raise DFIResponseError(event.data)
@@ -668,7 +859,23 @@ class Query:
 
         return unique_id_counts
 
-    def _receive_records(self, client: SSEClient) -> pd.DataFrame:
+    def _stream_records_chunked(
+        self, document: dict[str, Any], chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """Send a records query and yield its results, keeping the response open until the last chunk.
+
+        Parameters
+        ----------
+        document:
+            The validated query document.
+        chunk_size:
+            The maximum number of records in each DataFrame.
+        """
+        with self.conn.api_post("v1/query", json=document) as response:
+            client = SSEStream(response.iter_content(chunk_size=_CHUNK_SIZE))
+            yield from self._receive_records_chunked(client, chunk_size)
+
+    def _receive_records(self, client: SSEStream) -> pd.DataFrame:
         """Collect 'records' results into Pandas DataFrame.
 
         Parameters
@@ -684,7 +891,42 @@ class Query:
         NoFinishMessageReceivedError
         EventsMissedError
         """
-        records = []
+        return next(self._receive_records_chunked(client))
+
+    def _receive_records_chunked(
+        self, client: SSEStream, chunk_size: int | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """Collect 'records' results into Pandas DataFrames of at most `chunk_size` records.
+
+        Each DataFrame is yielded as soon as it is full, so only one chunk of records is held
+        in memory at a time.  A queryError or unknown event raises as soon as it arrives, while
+        a missing finish message or missed events can only be detected once the stream ends,
+        after every chunk received before then has been yielded.  A field missing from every
+        record of a chunk is absent from that chunk's DataFrame.
+
+        Parameters
+        ----------
+        client:
+            SSE client for response.
+        chunk_size:
+            The maximum number of records in each DataFrame.  If None, a single DataFrame
+            holding every record, possibly empty, is yielded.
+
+        Raises
+        ------
+        ValueError
+        DFIResponseError
+        UnkownMessageReceivedError
+        NoEventsRecievedError
+        NoFinishMessageReceivedError
+        EventsMissedError
+        """
+        if chunk_size is not None:
+            _check_chunk_size(chunk_size)
+
+        columns: dict[str, list[Any]] = {}
+        n_records = 0
+        n_collected = 0
         events_list_is_empty = True
         finish_message = False
         messages_received = 0
@@ -699,17 +941,31 @@ class Query:
         ):
             events_list_is_empty = False
 
+            # message events dominate a stream, so match them first
             match event.event:
-                case "keepAlive":
-                    continue
                 case "message":
                     messages_received += 1
-                    records += json.loads(event.data)
-                    pbar.set_description(f"Collecting {len(records):,} records.")
+                    for record in _json_loads(event.data):
+                        for key, value in record.items():
+                            column = columns.setdefault(key, [])
+                            if len(column) < n_records:
+                                # pad fields missing from earlier records
+                                column.extend([None] * (n_records - len(column)))
+                            column.append(value)
+                        n_records += 1
+                        if n_records == chunk_size:
+                            yield _records_frame(columns, n_records)
+                            n_collected += n_records
+                            columns, n_records = {}, 0
+                    pbar.set_description(
+                        f"Collecting {n_collected + n_records:,} records."
+                    )
+                    continue
+                case "keepAlive":
                     continue
                 case "finish":
                     finish_message = True
-                    messages_sent = json.loads(event.data).get("messageCount")
+                    messages_sent = _json_loads(event.data).get("messageCount")
                     break
                 case "queryError":
                     raise DFIResponseError(event.data)
@@ -729,7 +985,5 @@ class Query:
                 f"Received {messages_received}/{messages_sent} events from DFI API."
             )
 
-        if len(records) > 0:
-            return pd.DataFrame(records).assign(time=lambda df: pd.to_datetime(df.time))
-        else:
-            return pd.DataFrame(columns=["id", "coordinate", "time"])
+        if chunk_size is None or n_records > 0:
+            yield _records_frame(columns, n_records)
@@ -39,6 +39,13 @@ def response(
     DFIResponseError
         If there was an error querying the DFI API.
     """
+    success = int(resp.status_code // 100) == SUCCESS_CODES  # any code 2xx is a valid success response code
+
+    # formatting the message reads the whole (possibly streamed) body and serializes the payload,
+    # so skip it for successful responses unless it is going to be logged
+    if success and not _logger.isEnabledFor(logging.DEBUG):
+        return
+
     # prevent from showing the user token to terminal and logs
     headers = headers.copy()
     headers["Authorization"] = "Bearer XXX"
@@ -55,7 +62,7 @@ PARAMS: {json.dumps(params, sort_keys=True, indent=4)}
     else:
         msg += f"PAYLOAD: {json.dumps(None)}"
 
-    if int(resp.status_code // 100) != SUCCESS_CODES:  # any code 2xx is a valid success response code
+    if not success:
         _logger.error(msg)
         raise DFIResponseError(msg)
 
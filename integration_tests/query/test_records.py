@@ -261,3 +261,11 @@ def test_query_records_document_set(
     _ = dfi.query.records(dataset_id)
 
     assert isinstance(dfi.query.document, expected_type)
+
+
+def test_records_chunked(dfi: Client, dataset_id: str) -> None:
+    """Test records_chunked yields the same records as records, at most chunk_size at a time."""
+    chunk_size = 2
+    chunks = list(dfi.query.records_chunked(dataset_id, chunk_size=chunk_size))
+    assert all(chunk.shape[0] <= chunk_size for chunk in chunks)
+    assert sum(chunk.shape[0] for chunk in chunks) == dfi.query.records(dataset_id).shape[0]
@@ -0,0 +1,18 @@
+"""Configuration for model test fixtures."""
+
+from copy import deepcopy
+
+import pytest
+
+from dfi.models import QueryDocument
+from dfi.models.returns import Records
+
+
+@pytest.fixture(name="qd_template", scope="session")
+def get_query_document_template() -> QueryDocument:
+    return QueryDocument("test-dataset", Records())
+
+
+@pytest.fixture(name="qd")
+def get_query_document(qd_template: QueryDocument) -> QueryDocument:
+    return deepcopy(qd_template)
@@ -1,13 +1,15 @@
 """Unit tests for Point."""
 
+from contextlib import AbstractContextManager
 from contextlib import nullcontext as does_not_raise
 
 import pytest
-from _pytest.python_api import RaisesContext
 
 from dfi.errors import AltitudeOutOfBoundsError, LatitudeOutOfBoundsError, LongitudeOutOfBoundsError
 from dfi.models.filters.geometry import Point
 
+pytestmark = pytest.mark.unit
+
 
 @pytest.mark.parametrize(
     "lon,expectation",
@@ -21,7 +23,7 @@ from dfi.models.filters.geometry import Point
         (360.0, pytest.raises(LongitudeOutOfBoundsError)),
     ],
 )
-def test_validate_longitude(lon: float, expectation: RaisesContext) -> None:
+def test_validate_longitude(lon: float, expectation: AbstractContextManager[object]) -> None:
     """Test longitude value is within bounds and raises LongitudeOutOfBoundsError if not."""
     with expectation:
         Point._validate_longitude(lon)
@@ -39,7 +41,7 @@ def test_validate_longitude(lon: float, expectation: RaisesContext) -> None:
         (180.0, pytest.raises(LatitudeOutOfBoundsError)),
     ],
 )
-def test_validate_latitude(lat: float, expectation: RaisesContext) -> None:
+def test_validate_latitude(lat: float, expectation: AbstractContextManager[object]) -> None:
     """Test latitude value is within bounds and raises LatitudeOutOfBoundsError if not."""
     with expectation:
         Point._validate_latitude(lat)
@@ -53,7 +55,7 @@ def test_validate_latitude(lat: float, expectation: RaisesContext) -> None:
         (1.7976931348623157e308, pytest.raises(AltitudeOutOfBoundsError)),
     ],
 )
-def test_validate_altitude(alt: float, expectation: RaisesContext) -> None:
+def test_validate_altitude(alt: float, expectation: AbstractContextManager[object]) -> None:
     """Test altitude value is within bounds and raises AltitudeOutOfBoundsError if not."""
     with expectation:
         Point._validate_altitude(alt)
@@ -67,7 +69,7 @@ def test_validate_altitude(alt: float, expectation: RaisesContext) -> None:
         (0.0, 0.0, does_not_raise()),
     ],
 )
-def test_point(lon: float, lat: float, expectation: RaisesContext) -> None:
+def test_point(lon: float, lat: float, expectation: AbstractContextManager[object]) -> None:
     """Test Point can be built from coords and is valid."""
     with expectation:
         assert (lon, lat) == Point(lon, lat).build()
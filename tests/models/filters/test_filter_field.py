@@ -1,9 +1,11 @@
 """Tests for FilterField."""
 
-import logging
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
+from typing import Any
 
 import pytest
-from _pytest.python_api import RaisesContext
 
 from dfi.errors import (
     FilterFieldInvalidNullability,
@@ -15,19 +17,33 @@ from dfi.errors import (
 from dfi.models.filters import FieldType, FilterField, FilterOperator
 from dfi.models.filters.filter_fields import FieldValue
 
-_logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.unit
 
 UINT32_MIN = 0
 UINT32_MAX = 4_294_967_295
 INT32_MIN = -2_147_483_648
 INT32_MAX = 2_147_483_647
 
+# Schema shapes shared (read-only) across parametrize rows.
+_NUM_UNSIGNED = MappingProxyType({"type": "number", "signed": False})
+_NUM_SIGNED = MappingProxyType({"type": "number", "signed": True})
+_IP_NULLABLE = MappingProxyType({"type": "ip", "nullable": True})
+_VEG_NULLABLE = MappingProxyType({"type": "enum", "nullable": True, "values": ["carrot", "mustard"]})
+_FULL_SCHEMA: dict[str, Mapping[str, Any]] = {
+    "absolute distance": _NUM_UNSIGNED,
+    "delta distance": _NUM_SIGNED,
+    "ipv4": _IP_NULLABLE,
+    "vegetables": _VEG_NULLABLE,
+}
+
+_NON_EQ_OPS = ("lt", "lte", "gt", "gte", "between", "outside")
+
 
 @pytest.mark.parametrize(
-    "name,field_type,value,operation,schema,expectation",
+    "name,field_type,value,operation,schema,exc_type",
     [
-        ("vegetables", "enum", "califlower", FilterOperator("eq"), None, pytest.raises(ValueError)),
-        ("vegetables", FieldType("enum"), "califlower", "eq", None, pytest.raises(ValueError)),
+        ("vegetables", "enum", "califlower", FilterOperator("eq"), None, ValueError),
+        ("vegetables", FieldType("enum"), "califlower", "eq", None, ValueError),
     ],
 )
 def test_filter_field_argument_type_error_conditions(
@@ -36,15 +52,15 @@ def test_filter_field_argument_type_error_conditions(
     value: FieldValue,
     operation: FilterOperator,
     schema: dict | None,
-    expectation: RaisesContext[ValueError],
+    exc_type: type[Exception],
 ) -> None:
     """Test FilterField errors are raised."""
-    with expectation:
+    with pytest.raises(exc_type):
         FilterField(name, field_type, value, operation, schema=schema).build()
 
 
 @pytest.mark.parametrize(
-    "name,field_type,value,operation,schema,expectation",
+    "name,field_type,value,operation,schema,exc_type",
     [
         (
             "vegetables",
@@ -52,7 +68,7 @@ def test_filter_field_argument_type_error_conditions(
             "cauliflower",
             FilterOperator("eq"),
             {"fruits": {"type": "enum", "values": ["lychee", "durian", "tomato", "aubergine"]}},
-            pytest.raises(FilterFieldNameNotInSchema),
+            FilterFieldNameNotInSchema,
         ),
     ],
 )
@@ -62,15 +78,15 @@ def test_filter_field_name_error_conditions(
     value: FieldValue,
     operation: FilterOperator,
     schema: dict | None,  # type: ignore[type-arg]
-    expectation: RaisesContext[FilterFieldNameNotInSchema],
+    exc_type: type[Exception],
 ) -> None:
     """Test FilterField errors are raised for names that don't exist in the schema."""
-    with expectation:
+    with pytest.raises(exc_type):
         FilterField(name, field_type, value, operation, schema=schema).build()
 
 
 @pytest.mark.parametrize(
-    "name,field_type,value,operation,nullable,schema,expectation",
+    "name,field_type,value,operation,nullable,schema,exc_type",
     [
         (
             "vegetables",
@@ -79,7 +95,7 @@ def test_filter_field_name_error_conditions(
             FilterOperator("eq"),
             True,
             {"vegetables": {"type": "enum", "values": []}},
-            pytest.raises(FilterFieldInvalidNullability),
+            FilterFieldInvalidNullability,
         ),
         (
             "vegetables",
@@ -88,7 +104,7 @@ def test_filter_field_name_error_conditions(
             FilterOperator("eq"),
             True,
             {"vegetables": {"type": "enum", "nullable": False, "values": []}},
-            pytest.raises(FilterFieldInvalidNullability),
+            FilterFieldInvalidNullability,
         ),
         (
             "vegetables",
@@ -97,7 +113,7 @@ def test_filter_field_name_error_conditions(
             FilterOperator("eq"),
             False,
             {"vegetables": {"type": "enum", "nullable": True, "values": []}},
-            pytest.raises(FilterFieldInvalidNullability),
+            FilterFieldInvalidNullability,
         ),
     ],
 )
@@ -108,15 +124,15 @@ def test_filter_field_nullable_error_conditions(
     operation: FilterOperator,
     nullable: bool,
     schema: dict | None,  # type: ignore[type-arg]
-    expectation: RaisesContext[FilterFieldInvalidNullability],
+    exc_type: type[Exception],
 ) -> None:
     """Test FilterField errors are raised for non-matching nullability."""
-    with expectation:
+    with pytest.raises(exc_type):
         FilterField(name, field_type, value, operation, nullable, schema).build()
 
 
 @pytest.mark.parametrize(
-    "name,field_type,value,operation,schema,expectation",
+    "name,field_type,value,operation,schema,exc_type",
     [
         (
             "ip",
@@ -124,15 +140,15 @@ def test_filter_field_nullable_error_conditions(
             "0.0.0.0",
             FilterOperator("eq"),
             {"ip": {"type": "enum", "values": []}},
-            pytest.raises(FilterFieldTypeError),
+            FilterFieldTypeError,
         ),
         (
             "delta distance",
             FieldType("signed number"),
             [-22, 0],
             FilterOperator("outside"),
-            {"delta distance": {"type": "number", "signed": False}},
-            pytest.raises(FilterFieldTypeError),
+            {"delta distance": _NUM_UNSIGNED},
+            FilterFieldTypeError,
         ),
         (
             "delta distance",
@@ -140,15 +156,15 @@ def test_filter_field_nullable_error_conditions(
             [-22, 0],
             FilterOperator("outside"),
             {"delta distance": {"type": "number"}},
-            pytest.raises(FilterFieldTypeError),
+            FilterFieldTypeError,
         ),
         (
             "absolute distance",
             FieldType("unsigned number"),
             [22, 30],
             FilterOperator("between"),
-            {"absolute distance": {"type": "number", "signed": True}},
-            pytest.raises(FilterFieldTypeError),
+            {"absolute distance": _NUM_SIGNED},
+            FilterFieldTypeError,
         ),
     ],
 )
@@ -158,71 +174,35 @@ def test_filter_field_type_error_conditions(
     value: FieldValue,
     operation: FilterOperator,
     schema: dict | None,  # type: ignore[type-arg]
-    expectation: RaisesContext[FilterFieldOperationValueError],
+    exc_type: type[Exception],
 ) -> None:
     """Test FilterField errors are raised for FieldType.ENUM fields."""
-    with expectation:
+    with pytest.raises(exc_type):
         FilterField(name, field_type, value, operation, schema=schema).build()
 
 
 @pytest.mark.parametrize(
-    "name,field_type,value,operation,schema,expectation",
+    "name,field_type,value,operation,schema,exc_type",
     [
-        (
-            "vegetables",
-            FieldType("enum"),
-            "cauliflower",
-            FilterOperator("lt"),
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
-        (
-            "vegetables",
-            FieldType("enum"),
-            "cauliflower",
-            FilterOperator("lte"),
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
-        (
-            "vegetables",
-            FieldType("enum"),
-            "cauliflower",
-            FilterOperator("gt"),
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
-        (
-            "vegetables",
-            FieldType("enum"),
-            "cauliflower",
-            FilterOperator("gte"),
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
-        (
-            "vegetables",
-            FieldType("enum"),
-            "cauliflower",
-            FilterOperator("between"),
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
-        (
-            "vegetables",
-            FieldType("enum"),
-            "cauliflower",
-            FilterOperator("outside"),
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
+        *[
+            pytest.param(
+                "vegetables",
+                FieldType("enum"),
+                "cauliflower",
+                FilterOperator(op),
+                None,
+                FilterFieldOperationValueError,
+                id=op,
+            )
+            for op in _NON_EQ_OPS
+        ],
         (
             "vegetables",
             FieldType("enum"),
             "cauliflower",
             FilterOperator("eq"),
             {"vegetables": {"type": "enum", "values": ["broccoli", "carrot", "mustard"], "nullable": False}},
-            pytest.raises(FilterFieldValueError),
+            FilterFieldValueError,
         ),
         (
             "vegetables",
@@ -230,7 +210,7 @@ def test_filter_field_type_error_conditions(
             "cauliflower",
             FilterOperator("eq"),
             {"vegetables": {"type": "enum", "values": "mustard", "nullable": False}},
-            pytest.raises(TypeError),
+            TypeError,
         ),
         (
             "vegetables",
@@ -238,7 +218,7 @@ def test_filter_field_type_error_conditions(
             "cauliflower",
             FilterOperator("eq"),
             {"vegetables": {"type": "enum", "values": None, "nullable": False}},
-            pytest.raises(ValueError),
+            ValueError,
         ),
         (
             "vegetables",
@@ -246,7 +226,7 @@ def test_filter_field_type_error_conditions(
             1234,
             FilterOperator("eq"),
             {"vegetables": {"type": "enum", "values": ["broccoli", "carrot", "mustard"], "nullable": False}},
-            pytest.raises(ValueError),
+            ValueError,
         ),
     ],
 )
@@ -256,83 +236,37 @@ def test_filter_field_enum_error_conditions(
     value: FieldValue,
     operation: FilterOperator,
     schema: dict | None,  # type: ignore[type-arg]
-    expectation: RaisesContext[FilterFieldOperationValueError | FilterFieldValueError],
+    exc_type: type[Exception],
 ) -> None:
     """Test FilterField errors are raised for FieldType.ENUM fields."""
-    with expectation:
+    with pytest.raises(exc_type):
         FilterField(name, field_type, value, operation, schema=schema).build()
 
 
 @pytest.mark.parametrize(
-    "name,field_type,value,operation,nullable,schema,expectation",
+    "name,field_type,value,operation,nullable,schema,exc_type",
     [
-        (
-            "ipv4",
-            FieldType("ip"),
-            "0.0.0.0",
-            FilterOperator("lt"),
-            True,
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
-        (
-            "ipv4",
-            FieldType("ip"),
-            "0.0.0.0",
-            FilterOperator("lte"),
-            True,
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
-        (
-            "ipv4",
-            FieldType("ip"),
-            "0.0.0.0",
-            FilterOperator("gt"),
-            True,
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
-        (
-            "ipv4",
-            FieldType("ip"),
-            "0.0.0.0",
-            FilterOperator("gte"),
-            True,
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
-        (
-            "ipv4",
-            FieldType("ip"),
-            "0.0.0.0",
-            FilterOperator("between"),
-            True,
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
-        (
-            "ipv4",
-            FieldType("ip"),
-            "0.0.0.0",
-            FilterOperator("outside"),
-            True,
-            None,
-            pytest.raises(FilterFieldOperationValueError),
-        ),
+        *[
+            pytest.param(
+                "ipv4",
+                FieldType("ip"),
+                "0.0.0.0",
+                FilterOperator(op),
+                True,
+                None,
+                FilterFieldOperationValueError,
+                id=op,
+            )
+            for op in _NON_EQ_OPS
+        ],
         pytest.param(
             "ipv4",
             FieldType("ip"),
             "256.0.0.0",
             FilterOperator("eq"),
             True,
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
             id="address bytes out of range",
         ),
         pytest.param(
@@ -341,13 +275,8 @@ def test_filter_field_enum_error_conditions(
             "-1.0.0.0",
             FilterOperator("eq"),
             True,
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
             id="address bytes out of range",
         ),
         pytest.param(
@@ -356,13 +285,8 @@ def test_filter_field_enum_error_conditions(
             "0.0.0",
             FilterOperator("eq"),
             True,
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
             id="address <4 bytes",
         ),
         (
@@ -371,13 +295,8 @@ def test_filter_field_enum_error_conditions(
             255,
             FilterOperator("eq"),
             True,
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(ValueError),
+            _FULL_SCHEMA,
+            ValueError,
         ),
     ],
 )
@@ -388,93 +307,63 @@ def test_filter_field_ip_error_conditions(
     operation: FilterOperator,
     nullable: bool,
     schema: dict | None,  # type: ignore[type-arg]
-    expectation: RaisesContext[FilterFieldOperationValueError],
+    exc_type: type[Exception],
 ) -> None:
     """Test FilterField errors are raised for FieldType.IP fields."""
-    with expectation:
+    with pytest.raises(exc_type):
         FilterField(name, field_type, value, operation, nullable, schema=schema).build()
 
 
 @pytest.mark.parametrize(
-    "name,field_type,value,operation,schema,expectation",
+    "name,field_type,value,operation,schema,exc_type",
     [
         (
             "absolute distance",
             FieldType("unsigned number"),
             UINT32_MIN - 1,
             FilterOperator("eq"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
         ),
         (
             "absolute distance",
             FieldType("unsigned number"),
             UINT32_MAX + 1,
             FilterOperator("eq"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
         ),
         (
             "absolute distance",
             FieldType("unsigned number"),
             [UINT32_MIN - 1, 0],
             FilterOperator("between"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
         ),
         (
             "absolute distance",
             FieldType("unsigned number"),
             [0, UINT32_MAX + 1],
             FilterOperator("between"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
         ),
         (
             "absolute distance",
             FieldType("unsigned number"),
             0.0,
             FilterOperator("eq"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(ValueError),
+            _FULL_SCHEMA,
+            ValueError,
         ),
         (
             "absolute distance",
             FieldType("unsigned number"),
             None,
             FilterOperator("eq"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(ValueError),
+            _FULL_SCHEMA,
+            ValueError,
         ),
     ],
 )
@@ -484,93 +373,63 @@ def test_filter_field_unsigned_number_error_conditions(
     value: FieldValue,
     operation: FilterOperator,
     schema: dict | None,  # type: ignore[type-arg]
-    expectation: RaisesContext[FilterFieldOperationValueError],
+    exc_type: type[Exception],
 ) -> None:
     """Test FilterField errors are raised for FieldType.IP fields."""
-    with expectation:
+    with pytest.raises(exc_type):
         FilterField(name, field_type, value, operation, schema=schema).build()
 
 
 @pytest.mark.parametrize(
-    "name,field_type,value,operation,schema,expectation",
+    "name,field_type,value,operation,schema,exc_type",
     [
         (
             "delta distance",
             FieldType("signed number"),
             INT32_MIN - 1,
             FilterOperator("eq"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
         ),
         (
             "delta distance",
             FieldType("signed number"),
             INT32_MAX + 1,
             FilterOperator("eq"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
         ),
         (
             "delta distance",
             FieldType("signed number"),
             [INT32_MIN - 1, 0],
             FilterOperator("between"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
         ),
         (
             "delta distance",
             FieldType("signed number"),
             [0, INT32_MAX + 1],
             FilterOperator("between"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(FilterFieldValueError),
+            _FULL_SCHEMA,
+            FilterFieldValueError,
         ),
         (
             "delta distance",
             FieldType("signed number"),
             0.0,
             FilterOperator("eq"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(ValueError),
+            _FULL_SCHEMA,
+            ValueError,
         ),
         (
             "delta distance",
             FieldType("signed number"),
             None,
             FilterOperator("eq"),
-            {
-                "absolute distance": {"type": "number", "signed": False},
-                "delta distance": {"type": "number", "signed": True},
-                "ipv4": {"type": "ip", "nullable": True},
-                "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-            },
-            pytest.raises(ValueError),
+            _FULL_SCHEMA,
+            ValueError,
         ),
     ],
 )
@@ -580,16 +439,45 @@ def test_filter_field_signed_number_error_conditions(
     value: FieldValue,
     operation: FilterOperator,
     schema: dict | None,  # type: ignore[type-arg]
-    expectation: RaisesContext[FilterFieldOperationValueError],
+    exc_type: type[Exception],
 ) -> None:
     """Test FilterField errors are raised for FieldType.IP fields."""
-    with expectation:
+    with pytest.raises(exc_type):
         FilterField(name, field_type, value, operation, schema=schema).build()
 
 
 #########################
 # Normal Conditions
 #########################
+_SCHEMAS = {
+    0: _FULL_SCHEMA,
+    1: {**_FULL_SCHEMA, "absolute distance": {"type": "number"}},
+}
+
+
+@cache
+def _ff(
+    name: str,
+    field_type: str,
+    value: str | int | tuple[int, ...],
+    operation: str,
+    nullable: bool = False,
+    schema_id: int = 0,
+) -> FilterField:
+    """Build a FilterField once per unique set of arguments.
+
+    Arguments must be hashable, so list values are passed as tuples and schemas are referenced by key in `_SCHEMAS`.
+    """
+    return FilterField(
+        name,
+        FieldType(field_type),
+        list(value) if isinstance(value, tuple) else value,
+        FilterOperator(operation),
+        nullable=nullable,
+        schema=_SCHEMAS[schema_id],
+    )
+
+
 @pytest.mark.parametrize(
     "name,field_type,value,operation,schema,expected",
     [
@@ -614,7 +502,7 @@ def test_filter_field_signed_number_error_conditions(
             FieldType("unsigned number"),
             [22, 30],
             FilterOperator("between"),
-            {"absolute distance": {"type": "number", "signed": False}},
+            {"absolute distance": _NUM_UNSIGNED},
             {"absolute distance": {"between": [22, 30]}},
         ),
         (
@@ -622,7 +510,7 @@ def test_filter_field_signed_number_error_conditions(
             FieldType("signed number"),
             [-22, 0],
             FilterOperator("outside"),
-            {"delta distance": {"type": "number", "signed": True}},
+            {"delta distance": _NUM_SIGNED},
             {"delta distance": {"outside": [-22, 0]}},
         ),
     ],
@@ -643,149 +531,36 @@ def test_filter_field(
     "filter_fields,expected",
     [
         pytest.param(
-            [
-                FilterField(
-                    name="delta distance",
-                    field_type=FieldType("signed number"),
-                    value=[-22, 0],
-                    operation=FilterOperator("outside"),
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                        "ipv4": {"type": "ip", "nullable": True},
-                        "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-                    },
-                )
-            ],
+            [_ff("delta distance", "signed number", (-22, 0), "outside")],
             {"delta distance": {"outside": [-22, 0]}},
             id="signed number",
         ),
         pytest.param(
-            [
-                FilterField(
-                    name="absolute distance",
-                    field_type=FieldType("unsigned number"),
-                    value=[22, 30],
-                    operation=FilterOperator("between"),
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                        "ipv4": {"type": "ip", "nullable": True},
-                        "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-                    },
-                )
-            ],
+            [_ff("absolute distance", "unsigned number", (22, 30), "between")],
             {"absolute distance": {"between": [22, 30]}},
             id="unsigned number",
         ),
         pytest.param(
-            [
-                FilterField(
-                    name="absolute distance",
-                    field_type=FieldType("unsigned number"),
-                    value=[22, 30],
-                    operation=FilterOperator("between"),
-                    schema={
-                        "absolute distance": {"type": "number"},
-                        "delta distance": {"type": "number", "signed": True},
-                        "ipv4": {"type": "ip", "nullable": True},
-                        "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-                    },
-                )
-            ],
+            [_ff("absolute distance", "unsigned number", (22, 30), "between", schema_id=1)],
             {"absolute distance": {"between": [22, 30]}},
             id="unsigned number (unspecified)",
         ),
         pytest.param(
-            [
-                FilterField(
-                    name="ipv4",
-                    field_type=FieldType("ip"),
-                    value="0.0.0.0",
-                    operation=FilterOperator("eq"),
-                    nullable=True,
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                        "ipv4": {"type": "ip", "nullable": True},
-                        "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-                    },
-                )
-            ],
+            [_ff("ipv4", "ip", "0.0.0.0", "eq", nullable=True)],
             {"ipv4": {"eq": "0.0.0.0"}},
             id="ip",
         ),
         pytest.param(
-            [
-                FilterField(
-                    name="vegetables",
-                    field_type=FieldType("enum"),
-                    value="mustard",
-                    operation=FilterOperator("eq"),
-                    nullable=True,
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                        "ipv4": {"type": "ip", "nullable": True},
-                        "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-                    },
-                )
-            ],
+            [_ff("vegetables", "enum", "mustard", "eq", nullable=True)],
             {"vegetables": {"eq": "mustard"}},
             id="enum",
         ),
         pytest.param(
             [
-                FilterField(
-                    name="delta distance",
-                    field_type=FieldType("signed number"),
-                    value=[-22, 0],
-                    operation=FilterOperator("outside"),
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                        "ipv4": {"type": "ip", "nullable": True},
-                        "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-                    },
-                ),
-                FilterField(
-                    name="absolute distance",
-                    field_type=FieldType("unsigned number"),
-                    value=[22, 30],
-                    operation=FilterOperator("between"),
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                        "ipv4": {"type": "ip", "nullable": True},
-                        "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-                    },
-                ),
-                FilterField(
-                    name="ipv4",
-                    field_type=FieldType("ip"),
-                    value="0.0.0.0",
-                    operation=FilterOperator("eq"),
-                    nullable=True,
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                        "ipv4": {"type": "ip", "nullable": True},
-                        "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-                    },
-                ),
-                FilterField(
-                    name="vegetables",
-                    field_type=FieldType("enum"),
-                    value="mustard",
-                    operation=FilterOperator("eq"),
-                    nullable=True,
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                        "ipv4": {"type": "ip", "nullable": True},
-                        "vegetables": {"type": "enum", "nullable": True, "values": ["carrot", "mustard"]},
-                    },
-                ),
+                _ff("delta distance", "signed number", (-22, 0), "outside"),
+                _ff("absolute distance", "unsigned number", (22, 30), "between"),
+                _ff("ipv4", "ip", "0.0.0.0", "eq", nullable=True),
+                _ff("vegetables", "enum", "mustard", "eq", nullable=True),
             ],
             {
                 "absolute distance": {"between": [22, 30]},
@@ -802,7 +577,5 @@ def test_filter_fields_into_document(
     expected: dict,  # type: ignore[type-arg]
 ) -> None:
     """Test that a FilterFields dictionary can be built from a list of FilterFields."""
-    document = {}
-    for field in filter_fields:
-        document.update(field.build())
+    document = {key: value for field in filter_fields for key, value in field.build().items()}
     assert expected == document
@@ -1,149 +1,128 @@
 """Unit tests for TimeRange."""
 
-import logging
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import TypeAlias
 
 import pytest
-from _pytest.python_api import RaisesContext
 
 from dfi.errors import TimeRangeMismatchError, TimeRangeUndefinedError, TimeZoneUndefinedError
 from dfi.models.filters import TimeRange
 
-_logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.unit
 
+TimeBound: TypeAlias = datetime | str | int | None
 
-@pytest.mark.parametrize(
-    "expectation",
-    [(pytest.raises(TimeRangeUndefinedError))],
-)
-def test_timerange_undefined_error_condition(expectation: RaisesContext[TimeRangeUndefinedError]) -> None:
-    """Test PolygonUndefinedError is raised."""
-    with expectation:
-        TimeRange().validate()
-
-
-@pytest.mark.parametrize(
-    "min_time,max_time,expectation",
-    [
-        (datetime(2020, 1, 1, 0, 0, 0), datetime(2020, 1, 1, 0, 0, 1), pytest.raises(TimeZoneUndefinedError)),
-        (
-            datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc),
-            datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
-            pytest.raises(TimeRangeMismatchError),
-        ),
-    ],
-)
-def test_timerange_from_datetimes_error_conditions(
-    min_time: datetime, max_time: datetime, expectation: RaisesContext[TimeRangeMismatchError | TimeZoneUndefinedError]
-) -> None:
-    """Test TimeRange errors are raised."""
-    with expectation:
-        TimeRange().from_datetimes(min_time, max_time).build()
-
-
-@pytest.mark.parametrize(
-    "min_time,max_time,expected",
-    [
-        (None, None, {"minTime": None, "maxTime": None}),
-        (
-            None,
-            datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc),
-            {"minTime": None, "maxTime": "2020-01-01T00:00:01+00:00"},
-        ),
-        (
-            datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
-            None,
-            {"minTime": "2020-01-01T00:00:00+00:00", "maxTime": None},
-        ),
-        (
-            datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
-            datetime(2020, 1, 1, 0, 0, 1, tzinfo=timezone.utc),
-            {"minTime": "2020-01-01T00:00:00+00:00", "maxTime": "2020-01-01T00:00:01+00:00"},
-        ),
-    ],
-)
-def test_timerange_from_datetimes(min_time: datetime, max_time: datetime, expected: datetime) -> None:
-    """Test TimeRange can be built from datetimes."""
-    assert expected == TimeRange().from_datetimes(min_time, max_time).build()
+_T0_STR = "2020-01-01T00:00:00+00:00"
+_T1_STR = "2020-01-01T00:00:01+00:00"
+_T0_DT = datetime.fromisoformat(_T0_STR)
+_T1_DT = datetime.fromisoformat(_T1_STR)
+_T0_MS = 1577836800000
+_T1_MS = _T0_MS + 1000
+_EXPECTED_BOTH = MappingProxyType({"minTime": _T0_STR, "maxTime": _T1_STR})
+_EXPECTED_NONE = MappingProxyType({"minTime": None, "maxTime": None})
 
 
-@pytest.mark.parametrize(
-    "min_time,max_time,expectation",
-    [
-        ("2020-01-01T00:00:00", "2020-01-01T00:00:01", pytest.raises(TimeZoneUndefinedError)),
-        ("2020-01-01T00:00:01+00:00", "2020-01-01T00:00:00+00:00", pytest.raises(TimeRangeMismatchError)),
-    ],
-)
-def test_timerange_from_strings_error_conditions(
-    min_time: str, max_time: str, expectation: RaisesContext[TimeRangeMismatchError | TimeZoneUndefinedError]
-) -> None:
-    """Test TimeRange errors are raised."""
-    with expectation:
-        TimeRange().from_strings(min_time, max_time).build()
-
-
-@pytest.mark.parametrize(
-    "min_time,max_time,expected",
-    [
-        (None, None, {"minTime": None, "maxTime": None}),
-        (None, "2020-01-01T00:00:01+01:00", {"minTime": None, "maxTime": "2020-01-01T00:00:01+01:00"}),
-        ("2020-01-01T00:00:00+01:00", None, {"minTime": "2020-01-01T00:00:00+01:00", "maxTime": None}),
-        (
-            "2020-01-01T00:00:00+01:00",
-            "2020-01-01T00:00:01+01:00",
-            {"minTime": "2020-01-01T00:00:00+01:00", "maxTime": "2020-01-01T00:00:01+01:00"},
-        ),
-        (
-            "2020-01-01T00:00:00+01:00",
-            "2020-01-01T00:00:01+01:00",
-            {"minTime": "2020-01-01T00:00:00+01:00", "maxTime": "2020-01-01T00:00:01+01:00"},
-        ),
-    ],
-)
-def test_timerange_from_strings(min_time: str, max_time: str, expected: datetime) -> None:
-    """Test TimeRange can be built from ISO 8601 strings."""
-    assert expected == TimeRange().from_strings(min_time, max_time).build()
+@pytest.fixture(name="tr")
+def get_timerange_factory() -> type[TimeRange]:
+    return TimeRange
 
 
 @pytest.mark.parametrize(
-    "min_time,max_time,tz,expectation",
-    [
-        (
-            1577836801000,
-            1577836800000,
-            timezone.utc,
-            pytest.raises(TimeRangeMismatchError),
-        ),
-    ],
+    "exc_type",
+    [TimeRangeUndefinedError],
 )
-def test_timerange_from_millis_error_conditions(
-    min_time: int, max_time: int, tz: timezone, expectation: RaisesContext[TimeRangeMismatchError]
+def test_timerange_undefined_error_condition(tr: type[TimeRange], exc_type: type[Exception]) -> None:
+    """Test PolygonUndefinedError is raised."""
+    with pytest.raises(exc_type):
+        tr().validate()
+
+
+def build_timerange(time_range: TimeRange, encoding: str, min_time: TimeBound, max_time: TimeBound) -> dict:
+    """Build a TimeRange from bounds in the given encoding (`datetimes`, `strings` or `millis`)."""
+    match encoding:
+        case "datetimes":
+            return time_range.from_datetimes(min_time, max_time).build()  # type: ignore[arg-type]
+        case "strings":
+            return time_range.from_strings(min_time, max_time).build()  # type: ignore[arg-type]
+        case "millis":
+            return time_range.from_millis(min_time, max_time, timezone.utc).build()  # type: ignore[arg-type]
+        case _:
+            raise ValueError(f"Unknown TimeRange encoding '{encoding}'")
+
+
+_TIMERANGE_CASES = [
+    # Error Conditions
+    pytest.param(
+        "datetimes",
+        _T0_DT.replace(tzinfo=None),
+        _T1_DT.replace(tzinfo=None),
+        None,
+        TimeZoneUndefinedError,
+        id="dt_naive",
+    ),
+    pytest.param("datetimes", _T1_DT, _T0_DT, None, TimeRangeMismatchError, id="dt_mismatch"),
+    pytest.param("strings", "2020-01-01T00:00:00", "2020-01-01T00:00:01", None, TimeZoneUndefinedError, id="str_naive"),
+    pytest.param("strings", _T1_STR, _T0_STR, None, TimeRangeMismatchError, id="str_mismatch"),
+    pytest.param("millis", _T1_MS, _T0_MS, None, TimeRangeMismatchError, id="ms_mismatch"),
+    # Normal Conditions
+    pytest.param("datetimes", None, None, _EXPECTED_NONE, None, id="dt_both_none"),
+    pytest.param("datetimes", None, _T1_DT, {"minTime": None, "maxTime": _T1_STR}, None, id="dt_max_only"),
+    pytest.param("datetimes", _T0_DT, None, {"minTime": _T0_STR, "maxTime": None}, None, id="dt_min_only"),
+    pytest.param("datetimes", _T0_DT, _T1_DT, _EXPECTED_BOTH, None, id="dt_both"),
+    pytest.param("strings", None, None, _EXPECTED_NONE, None, id="str_both_none"),
+    pytest.param(
+        "strings",
+        None,
+        "2020-01-01T00:00:01+01:00",
+        {"minTime": None, "maxTime": "2020-01-01T00:00:01+01:00"},
+        None,
+        id="str_max_only",
+    ),
+    pytest.param(
+        "strings",
+        "2020-01-01T00:00:00+01:00",
+        None,
+        {"minTime": "2020-01-01T00:00:00+01:00", "maxTime": None},
+        None,
+        id="str_min_only",
+    ),
+    pytest.param(
+        "strings",
+        "2020-01-01T00:00:00+01:00",
+        "2020-01-01T00:00:01+01:00",
+        {"minTime": "2020-01-01T00:00:00+01:00", "maxTime": "2020-01-01T00:00:01+01:00"},
+        None,
+        id="str_both",
+    ),
+    pytest.param("millis", None, None, _EXPECTED_NONE, None, id="ms_both_none"),
+    pytest.param("millis", None, _T1_MS, {"minTime": None, "maxTime": _T1_STR}, None, id="ms_max_only"),
+    pytest.param("millis", _T0_MS, None, {"minTime": _T0_STR, "maxTime": None}, None, id="ms_min_only"),
+    pytest.param("millis", _T0_MS, _T1_MS, _EXPECTED_BOTH, None, id="ms_both"),
+    pytest.param(
+        "millis",
+        1577836800001,
+        1577836801001,
+        {"minTime": "2020-01-01T00:00:00.001000+00:00", "maxTime": "2020-01-01T00:00:01.001000+00:00"},
+        None,
+        id="ms_fraction",
+    ),
+]
+
+
+@pytest.mark.parametrize("encoding,min_time,max_time,expected,exc_type", _TIMERANGE_CASES)
+def test_timerange_build(
+    tr: type[TimeRange],
+    encoding: str,
+    min_time: TimeBound,
+    max_time: TimeBound,
+    expected: Mapping[str, str | None] | None,
+    exc_type: type[Exception] | None,
 ) -> None:
-    """Test TimeRange errors are raised."""
-    with expectation:
-        TimeRange().from_millis(min_time, max_time, tz).build()
-
-
-@pytest.mark.parametrize(
-    "min_time,max_time,tz,expected",
-    [
-        (None, None, timezone.utc, {"minTime": None, "maxTime": None}),
-        (None, 1577836801000, timezone.utc, {"minTime": None, "maxTime": "2020-01-01T00:00:01+00:00"}),
-        (1577836800000, None, timezone.utc, {"minTime": "2020-01-01T00:00:00+00:00", "maxTime": None}),
-        (
-            1577836800000,
-            1577836801000,
-            timezone.utc,
-            {"minTime": "2020-01-01T00:00:00+00:00", "maxTime": "2020-01-01T00:00:01+00:00"},
-        ),
-        (
-            1577836800001,
-            1577836801001,
-            timezone.utc,
-            {"minTime": "2020-01-01T00:00:00.001000+00:00", "maxTime": "2020-01-01T00:00:01.001000+00:00"},
-        ),
-    ],
-)
-def test_timerange_from_millis(min_time: int, max_time: int, tz: timezone, expected: datetime) -> None:
-    """Test TimeRange can be built from integers representing milliseconds from Unix epoch."""
-    assert expected == TimeRange().from_millis(min_time, max_time, tz).build()
+    """Test TimeRange can be built from each encoding, or raises the expected error."""
+    if exc_type is None:
+        assert expected == build_timerange(tr(), encoding, min_time, max_time)
+    else:
+        with pytest.raises(exc_type):
+            build_timerange(tr(), encoding, min_time, max_time)
@@ -0,0 +1,21 @@
+"""Benchmarks for building TimeRange filters.
+
+Deselected by default, run with `pytest tests -m benchmark` (requires pytest-benchmark).
+"""
+
+from typing import Any
+
+import pytest
+
+from dfi.models.filters import TimeRange
+
+pytestmark = pytest.mark.benchmark
+
+_T0_STR = "2020-01-01T00:00:00+00:00"
+_T1_STR = "2020-01-01T00:00:01+00:00"
+
+
+def test_bench_from_strings(benchmark: Any) -> None:
+    """Benchmark building a TimeRange from ISO 8601 strings."""
+    result = benchmark(lambda: TimeRange().from_strings(_T0_STR, _T1_STR).build())
+    assert result == {"minTime": _T0_STR, "maxTime": _T1_STR}
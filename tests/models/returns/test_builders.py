@@ -0,0 +1,69 @@
+"""Tests for the return model builders: Count, GroupBy and Records."""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from dfi.models.returns import Count, GroupBy, IncludeField, Records
+
+pytestmark = pytest.mark.unit
+
+_GB_UID = GroupBy("uniqueId")
+_IF_FIELDS = IncludeField("fields")
+_IF_META = IncludeField("metadataId")
+_EXPECTED_COUNT_UID = MappingProxyType({"type": "count", "groupBy": {"type": "uniqueId"}})
+_EXPECTED_RECORDS_FIELDS = MappingProxyType({"type": "records", "include": ["fields"]})
+_EXPECTED_RECORDS_META = MappingProxyType({"type": "records", "include": ["metadataId"]})
+_EXPECTED_RECORDS_BOTH = MappingProxyType({"type": "records", "include": ["fields", "metadataId"]})
+
+
+def test_builders_error_conditions() -> None:
+    """Test return model builders reject invalid input."""
+    invalid: list[tuple[type[Count | GroupBy | Records], dict[str, Any]]] = [
+        (Count, {"groupby": "altitude"}),
+        (Count, {"groupby": 1234}),
+        (GroupBy, {"value": "altitude"}),
+        (GroupBy, {"value": 1234}),
+        (Records, {"include": []}),
+        (Records, {"include": [None]}),
+        (Records, {"include": [1234]}),
+        (Records, {"include": "fields"}),
+    ]
+    for builder_cls, kwargs in invalid:
+        with pytest.raises(ValueError):
+            builder_cls(**kwargs)
+
+
+_BUILDER_CASES = [
+    # Count
+    (Count, {"groupby": None}, {"type": "count"}),
+    (Count, {"groupby": _GB_UID}, _EXPECTED_COUNT_UID),
+    (Count, {"groupby": "uniqueId"}, _EXPECTED_COUNT_UID),
+    # GroupBy
+    (GroupBy, {"value": "uniqueId"}, {"groupBy": {"type": "uniqueId"}}),
+    # Records
+    (Records, {"include": None}, {"type": "records"}),
+    (Records, {"include": [_IF_FIELDS]}, _EXPECTED_RECORDS_FIELDS),
+    (Records, {"include": [_IF_META]}, _EXPECTED_RECORDS_META),
+    (Records, {"include": [_IF_FIELDS, _IF_META]}, _EXPECTED_RECORDS_BOTH),
+]
+
+
+@pytest.mark.parametrize("builder_cls,kwargs,expected", _BUILDER_CASES)
+def test_builders(
+    builder_cls: type[Count | GroupBy | Records],
+    kwargs: dict[str, Any],
+    expected: Mapping[str, Any],
+) -> None:
+    """Test return model builders build."""
+    assert expected == builder_cls(**kwargs).build()
+
+
+@given(include=st.lists(st.sampled_from(["fields", "metadataId"]), min_size=1, max_size=2, unique=True))
+def test_records_implicit_include_conversion(include: list[IncludeField | str]) -> None:
+    """Test Records converts any list of IncludeField strings."""
+    assert {"type": "records", "include": include} == Records(include=include).build()
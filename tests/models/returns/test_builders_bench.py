@@ -0,0 +1,18 @@
+"""Benchmarks for building return models.
+
+Deselected by default, run with `pytest tests -m benchmark` (requires pytest-benchmark).
+"""
+
+from typing import Any
+
+import pytest
+
+from dfi.models.returns import Records
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_bench_records_include(benchmark: Any) -> None:
+    """Benchmark building a Records return model with implicit IncludeField conversion."""
+    result = benchmark(lambda: Records(include=["fields", "metadataId"]).build())
+    assert result == {"type": "records", "include": ["fields", "metadataId"]}
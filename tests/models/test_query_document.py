@@ -1,10 +1,10 @@
 """Unit tests for QueryDocument."""
 
-import logging
 from datetime import datetime
+from itertools import product
+from typing import Any
 
 import pytest
-from _pytest.python_api import RaisesContext
 
 from dfi.errors import (
     BBoxUndefinedError,
@@ -17,29 +17,48 @@ from dfi.models.filters import FieldType, FilterField, FilterOperator, Only, Tim
 from dfi.models.filters.geometry import BBox, Point, Polygon, RawCoords
 from dfi.models.returns import Count, GroupBy, Records
 
-_logger = logging.getLogger(__name__)
-
-#########################
-# Error Conditions
-#########################
+pytestmark = pytest.mark.unit
+
+_COUNT = Count()
+_COUNT_BY_UID = Count(groupby=GroupBy("uniqueId"))
+_RECORDS = Records()
+_BAD_ONLY = [Only("newest"), Only("oldest")]
+_BAD_RM = [_COUNT, _COUNT_BY_UID]
+_POLY = Polygon().from_raw_coords([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.0, 0.0)])
+_TIME = TimeRange().from_strings("2020-01-01T00:00:00+00:00", "2020-01-01T00:00:01+00:00")
+_FF_SCHEMA = {
+    "absolute distance": {"type": "number", "signed": False},
+    "delta distance": {"type": "number", "signed": True},
+}
+_FFS_SAME_NAME = [
+    FilterField(
+        name="delta distance",
+        field_type=FieldType("signed number"),
+        value=[-22, 0],
+        operation=FilterOperator(op),
+        schema=_FF_SCHEMA,
+    )
+    for op in ("outside", "between")
+]
+_FF_OUTSIDE = _FFS_SAME_NAME[0]
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,expectation",
+    "dataset_id,return_model,exc_type",
     [
-        (None, Records(), pytest.raises(InvalidQueryDocument)),
-        (1234, Records(), pytest.raises(InvalidQueryDocument)),
-        ("test-dataset", None, pytest.raises(InvalidQueryDocument)),
-        ("test-dataset", "records", pytest.raises(InvalidQueryDocument)),
+        (None, _RECORDS, InvalidQueryDocument),
+        (1234, _RECORDS, InvalidQueryDocument),
+        ("test-dataset", None, InvalidQueryDocument),
+        ("test-dataset", "records", InvalidQueryDocument),
     ],
 )
 def test_query_document_initialization_error_conditions(
     dataset_id: str | None,
     return_model: Records | Count | None,
-    expectation: RaisesContext[InvalidQueryDocument],
+    exc_type: type[Exception],
 ) -> None:
     """Test QueryDocument errors are raised."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = QueryDocument(
             dataset_id=dataset_id,  # type: ignore
             return_model=return_model,  # type: ignore
@@ -47,18 +66,18 @@ def test_query_document_initialization_error_conditions(
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,expectation",
+    "dataset_id,return_model,exc_type",
     [
-        ("test-dataset", Records(), pytest.raises(InvalidQueryDocument)),
+        ("test-dataset", _RECORDS, InvalidQueryDocument),
     ],
 )
 def test_set_dataset_id_error_conditions(
     dataset_id: str,
     return_model: Records | Count,
-    expectation: RaisesContext[InvalidQueryDocument],
+    exc_type: type[Exception],
 ) -> None:
     """Test QueryDocument errors are raised when an invalid dataset_id is set."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = (
             QueryDocument(
                 dataset_id=dataset_id,
@@ -70,23 +89,23 @@ def test_set_dataset_id_error_conditions(
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,expectation",
+    "dataset_id,return_model,exc_type",
     [
-        ("test-dataset", None, pytest.raises(InvalidQueryDocument)),
-        ("test-dataset", "records", pytest.raises(InvalidQueryDocument)),
+        ("test-dataset", None, InvalidQueryDocument),
+        ("test-dataset", "records", InvalidQueryDocument),
     ],
 )
 def test_set_return_model_error_conditions(
     dataset_id: str,
     return_model: Records | str | None,
-    expectation: RaisesContext[InvalidQueryDocument],
+    exc_type: type[Exception],
 ) -> None:
     """Test QueryDocument errors are raised when an invalid return_model is set."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = (
             QueryDocument(
                 dataset_id=dataset_id,
-                return_model=Count(),
+                return_model=_COUNT,
             )
             .set_return_model(return_model)  # type: ignore
             .build()
@@ -94,31 +113,20 @@ def test_set_return_model_error_conditions(
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,only,expectation",
+    "dataset_id,return_model,only,exc_type",
     [
-        ("test-dataset", Count(), "newest", pytest.raises(InvalidQueryDocument)),
-        (
-            "test-dataset",
-            Count(groupby=GroupBy("uniqueId")),
-            Only("newest"),
-            pytest.raises(InvalidQueryDocument),
-        ),
-        (
-            "test-dataset",
-            Count(groupby=GroupBy("uniqueId")),
-            Only("oldest"),
-            pytest.raises(InvalidQueryDocument),
-        ),
+        ("test-dataset", _COUNT, "newest", InvalidQueryDocument),
+        *[("test-dataset", rm, only, InvalidQueryDocument) for only, rm in product(_BAD_ONLY, _BAD_RM)],
     ],
 )
 def test_set_only_error_conditions(
     dataset_id: str,
     return_model: Count,
     only: Only | str | None,
-    expectation: RaisesContext[InvalidQueryDocument],
+    exc_type: type[Exception],
 ) -> None:
     """Test QueryDocument errors are raised when an invalid only filter is set."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = (
             QueryDocument(
                 dataset_id=dataset_id,
@@ -130,19 +138,19 @@ def test_set_only_error_conditions(
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,uids,expectation",
+    "dataset_id,return_model,uids,exc_type",
     [
-        ("test-dataset", Count(), "aaa", pytest.raises(ValueError)),
+        ("test-dataset", _COUNT, "aaa", ValueError),
     ],
 )
 def test_set_uids_error_conditions(
     dataset_id: str,
     return_model: Count,
     uids: str,
-    expectation: RaisesContext[ValueError],
+    exc_type: type[Exception],
 ) -> None:
     """Test QueryDocument errors are raised when an invalid only filter is set."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = (
             QueryDocument(
                 dataset_id=dataset_id,
@@ -154,38 +162,38 @@ def test_set_uids_error_conditions(
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,time_range,expectation",
+    "dataset_id,return_model,time_range,exc_type",
     [
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             datetime(2020, 1, 1, 0, 0, 0),
-            pytest.raises(ValueError),
+            ValueError,
         ),
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             (datetime(2020, 1, 1, 0, 0, 0), datetime(2020, 1, 2, 0, 0, 0)),
-            pytest.raises(ValueError),
+            ValueError,
         ),
-        ("test-dataset", Count(), "2020-01-01T00:00:00", pytest.raises(ValueError)),
+        ("test-dataset", _COUNT, "2020-01-01T00:00:00", ValueError),
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             ("2020-01-01T00:00:00", "2020-01-02T00:00:00"),
-            pytest.raises(ValueError),
+            ValueError,
         ),
-        ("test-dataset", Count(), TimeRange(), pytest.raises(TimeRangeUndefinedError)),
+        ("test-dataset", _COUNT, TimeRange(), TimeRangeUndefinedError),
     ],
 )
 def test_set_time_range_error_conditions(
     dataset_id: str,
     return_model: Count,
     time_range: str,
-    expectation: RaisesContext[ValueError],
+    exc_type: type[Exception],
 ) -> None:
     """Test QueryDocument errors are raised when an invalid TimeRange filter is set."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = (
             QueryDocument(
                 dataset_id=dataset_id,
@@ -197,11 +205,11 @@ def test_set_time_range_error_conditions(
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,geometry,expectation",
+    "dataset_id,return_model,geometry,exc_type",
     [
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             [
                 Point(0.0, 0.0),
                 Point(1.0, 0.0),
@@ -209,25 +217,25 @@ def test_set_time_range_error_conditions(
                 Point(0.0, 1.0),
                 Point(0.0, 0.0),
             ],
-            pytest.raises(ValueError),
+            ValueError,
         ),
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]],
-            pytest.raises(ValueError),
+            ValueError,
         ),
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             Polygon(),
-            pytest.raises(PolygonUndefinedError),
+            PolygonUndefinedError,
         ),
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             BBox(),
-            pytest.raises(BBoxUndefinedError),
+            BBoxUndefinedError,
         ),
     ],
 )
@@ -235,10 +243,10 @@ def test_set_geometry_error_conditions(
     dataset_id: str,
     return_model: Count,
     geometry: list[RawCoords] | list[Point],
-    expectation: RaisesContext[ValueError | PolygonUndefinedError | BBoxUndefinedError],
+    exc_type: type[Exception],
 ) -> None:
     """Test QueryDocument errors are raised when an invalid geometry filter is set."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = (
             QueryDocument(
                 dataset_id=dataset_id,
@@ -250,19 +258,19 @@ def test_set_geometry_error_conditions(
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,filter_field,expectation",
+    "dataset_id,return_model,filter_field,exc_type",
     [
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             None,
-            pytest.raises(ValueError),
+            ValueError,
         ),
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             {"vegetable": "cauliflower"},
-            pytest.raises(ValueError),
+            ValueError,
         ),
     ],
 )
@@ -270,10 +278,10 @@ def test_set_filter_field_error_conditions(
     dataset_id: str,
     return_model: Count,
     filter_field: dict[str, str] | None,
-    expectation: RaisesContext[ValueError],
+    exc_type: type[Exception],
 ) -> None:
     """Test QueryDocument errors are raised when an invalid Filter Field filter is set."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = (
             QueryDocument(
                 dataset_id=dataset_id,
@@ -285,19 +293,19 @@ def test_set_filter_field_error_conditions(
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,filter_fields,expectation",
+    "dataset_id,return_model,filter_fields,exc_type",
     [
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             {"vegetable": "cauliflower"},
-            pytest.raises(ValueError),
+            ValueError,
         ),
         (
             "test-dataset",
-            Count(),
+            _COUNT,
             [{"vegetable": "cauliflower"}, {"ip": "0.0.0.0"}],
-            pytest.raises(ValueError),
+            ValueError,
         ),
     ],
 )
@@ -305,10 +313,10 @@ def test_set_filter_fields_error_conditions(
     dataset_id: str,
     return_model: Count,
     filter_fields: list[dict[str, str]] | dict[str, str],
-    expectation: RaisesContext[ValueError],
+    exc_type: type[Exception],
 ) -> None:
     """Test QueryDocument errors are raised when an invalid Filter Fields filter is set."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = (
             QueryDocument(
                 dataset_id=dataset_id,
@@ -320,187 +328,98 @@ def test_set_filter_fields_error_conditions(
 
 
 @pytest.mark.parametrize(
-    "dataset_id,expectation",
+    "dataset_id,exc_type",
     [
-        (None, pytest.raises(InvalidQueryDocument)),
-        (1234, pytest.raises(InvalidQueryDocument)),
+        (None, InvalidQueryDocument),
+        (1234, InvalidQueryDocument),
     ],
 )
 def test_validate_dataset_id_raises_errors(
     dataset_id: int | None,
-    expectation: RaisesContext[InvalidQueryDocument],
+    exc_type: type[Exception],
 ) -> None:
     """Test _validate_dataset_id errors are raised when an invalid dataset_id is set."""
-    with expectation:
+    with pytest.raises(exc_type):
         QueryDocument._validate_dataset_id(dataset_id)  # type: ignore
 
 
 @pytest.mark.parametrize(
-    "return_model,expectation",
+    "return_model,exc_type",
     [
-        (None, pytest.raises(InvalidQueryDocument)),
-        ("records", pytest.raises(InvalidQueryDocument)),
+        (None, InvalidQueryDocument),
+        ("records", InvalidQueryDocument),
     ],
 )
 def test_validate_return_model_raises_errors(
     return_model: str | None,
-    expectation: RaisesContext[InvalidQueryDocument],
+    exc_type: type[Exception],
 ) -> None:
     """Test _validate_return_model errors are raised when an invalid return_model is set."""
-    with expectation:
+    with pytest.raises(exc_type):
         QueryDocument._validate_return_model(return_model)  # type: ignore
 
 
 @pytest.mark.parametrize(
-    "only,return_model,expectation",
-    [
-        (Only("newest"), Count(), pytest.raises(InvalidQueryDocument)),
-        (Only("oldest"), Count(), pytest.raises(InvalidQueryDocument)),
-        (
-            Only("newest"),
-            Count(groupby=GroupBy("uniqueId")),
-            pytest.raises(InvalidQueryDocument),
-        ),
-        (
-            Only("oldest"),
-            Count(groupby=GroupBy("uniqueId")),
-            pytest.raises(InvalidQueryDocument),
-        ),
-    ],
+    "only,return_model,exc_type",
+    [(only, rm, InvalidQueryDocument) for only, rm in product(_BAD_ONLY, _BAD_RM)],
 )
 def test_validate_only_filter_raises_errors(
     only: str | None,
     return_model: Count,
-    expectation: RaisesContext[InvalidQueryDocument],
+    exc_type: type[Exception],
 ) -> None:
     """Test _validate_only_filter errors are raised when an invalid only filter and return_model are set."""
-    with expectation:
+    with pytest.raises(exc_type):
         QueryDocument._validate_only_filter(only, return_model)  # type: ignore
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,only,expectation",
-    [
-        (None, None, None, pytest.raises(InvalidQueryDocument)),
-        ("test-dataset", None, None, pytest.raises(InvalidQueryDocument)),
-        ("test-dataset", "records", None, pytest.raises(InvalidQueryDocument)),
-        (None, Records(), None, pytest.raises(InvalidQueryDocument)),
-        (1234, Records(), None, pytest.raises(InvalidQueryDocument)),
-        # invalid only x return_model combos
-        ("test-dataset", Only("newest"), Count(), pytest.raises(InvalidQueryDocument)),
-        ("test-dataset", Only("oldest"), Count(), pytest.raises(InvalidQueryDocument)),
-        (
-            "test-dataset",
-            Only("newest"),
-            Count(groupby=GroupBy("uniqueId")),
-            pytest.raises(InvalidQueryDocument),
-        ),
-        (
-            "test-dataset",
-            Only("oldest"),
-            Count(groupby=GroupBy("uniqueId")),
-            pytest.raises(InvalidQueryDocument),
-        ),
-    ],
+    "dataset_id,return_model,only,exc_type",
+    [("test-dataset", rm, only, InvalidQueryDocument) for only, rm in product(_BAD_ONLY, _BAD_RM)],
 )
 def test_validate_raises_errors(
-    dataset_id: str | int | None,
-    return_model: Records | Count | str | None,
+    dataset_id: str,
+    return_model: Count,
     only: Only,
-    expectation: RaisesContext[InvalidQueryDocument],
+    exc_type: type[Exception],
 ) -> None:
-    """Test _validate_return_model errors are raised when an invalid return_model is set."""
-    with expectation:
+    """Test validate errors are raised when an invalid only filter and return_model are combined."""
+    with pytest.raises(exc_type):
         QueryDocument(dataset_id=dataset_id, return_model=return_model, only=only).validate()  # type: ignore
 
 
 #########################
 # Normal Conditions
 #########################
-@pytest.mark.parametrize(
-    "dataset_id,return_model,uids,geometry,time_range,filter_fields,only,expected",
-    [
-        (
-            "test-dataset",
-            Records(),
-            None,
-            None,
-            None,
-            None,
-            None,
-            {"datasetId": "test-dataset", "filters": {}, "return": {"type": "records"}},
-        ),
-        (
-            "test-dataset",
-            Records(),
-            ["aaa"],
-            Polygon().from_raw_coords(
-                [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.0, 0.0)]
-            ),
-            TimeRange().from_strings(
-                "2020-01-01T00:00:00+00:00", "2020-01-01T00:00:01+00:00"
-            ),
-            [
-                FilterField(
-                    name="delta distance",
-                    field_type=FieldType("signed number"),
-                    value=[-22, 0],
-                    operation=FilterOperator("outside"),
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                    },
-                ),
-            ],
-            Only("newest"),
-            {
-                "datasetId": "test-dataset",
-                "filters": {
-                    "id": ["aaa"],
-                    "geo": {
-                        "type": "Polygon",
-                        "coordinates": (
-                            (0.0, 0.0),
-                            (1.0, 0.0),
-                            (1.0, 1.0),
-                            (0.0, 1.0),
-                            (0.0, 0.0),
-                        ),
-                    },
-                    "time": {
-                        "maxTime": "2020-01-01T00:00:01+00:00",
-                        "minTime": "2020-01-01T00:00:00+00:00",
-                    },
-                    "only": "newest",
-                    "fields": {"delta distance": {"outside": [-22, 0]}},
-                },
-                "return": {"type": "records"},
-            },
-        ),
-    ],
-)
-def test_query_document(
-    dataset_id: str,
-    return_model: Records,
-    uids: list[str | int] | None,
-    geometry: Polygon | BBox | None,
-    time_range: TimeRange | None,
-    filter_fields: list[FilterField] | None,
-    only: Only | None,
-    expected: dict,
-) -> None:
-    """Test QueryDocument can be built from inputs."""
+def test_query_document_full() -> None:
+    """Test QueryDocument can be built with every filter set."""
     document = QueryDocument(
-        dataset_id=dataset_id,
-        return_model=return_model,
-        uids=uids,  # type: ignore
-        geometry=geometry,
-        time_range=time_range,
-        filter_fields=filter_fields,
-        only=only,
+        dataset_id="test-dataset",
+        return_model=_RECORDS,
+        uids=["aaa"],
+        geometry=_POLY,
+        time_range=_TIME,
+        filter_fields=[_FF_OUTSIDE],
+        only=Only("newest"),
     ).build()
 
-    assert expected == document
+    assert {
+        "datasetId": "test-dataset",
+        "filters": {
+            "id": ["aaa"],
+            "geo": {
+                "type": "Polygon",
+                "coordinates": ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.0, 0.0)),
+            },
+            "time": {
+                "maxTime": "2020-01-01T00:00:01+00:00",
+                "minTime": "2020-01-01T00:00:00+00:00",
+            },
+            "only": "newest",
+            "fields": {"delta distance": {"outside": [-22, 0]}},
+        },
+        "return": {"type": "records"},
+    } == document
 
 
 @pytest.mark.parametrize("dataset_id", [("test-dataset")])
@@ -509,9 +428,7 @@ def test_validate_dataset_id(dataset_id: str) -> None:
     QueryDocument._validate_dataset_id(dataset_id)
 
 
-@pytest.mark.parametrize(
-    "return_model", [(Count()), (Count(groupby=GroupBy("uniqueId"))), (Records())]
-)
+@pytest.mark.parametrize("return_model", [_COUNT, _COUNT_BY_UID, _RECORDS])
 def test_validate_return_model(return_model: Records | Count) -> None:
     """Test validate_return_model does not raise error when valid return_model given."""
     QueryDocument._validate_return_model(return_model)
@@ -520,9 +437,9 @@ def test_validate_return_model(return_model: Records | Count) -> None:
 @pytest.mark.parametrize(
     "dataset_id,return_model",
     [
-        ("test-dataset", Count()),
-        ("test-dataset", Count(groupby=GroupBy("uniqueId"))),
-        ("test-dataset", Records()),
+        ("test-dataset", _COUNT),
+        ("test-dataset", _COUNT_BY_UID),
+        ("test-dataset", _RECORDS),
     ],
 )
 def test_validate(dataset_id: str, return_model: Records | Count) -> None:
@@ -530,367 +447,92 @@ def test_validate(dataset_id: str, return_model: Records | Count) -> None:
     QueryDocument(dataset_id=dataset_id, return_model=return_model).validate()
 
 
-@pytest.mark.parametrize(
-    "dataset_id,return_model,expected",
-    [
-        (
-            "test-dataset-2",
-            Records(),
-            {
-                "datasetId": "test-dataset-2",
-                "filters": {},
-                "return": {"type": "records"},
-            },
-        ),
-    ],
-)
-def test_set_dataset_id(dataset_id: str, return_model: Records, expected: dict) -> None:
-    """Test set_dataset_id builds properly."""
-    assert (
-        expected
-        == QueryDocument("test-dataset", return_model)
-        .set_dataset_id(dataset_id)
-        .build()
-    )
-
-
-@pytest.mark.parametrize(
-    "dataset_id,initial_return_model,return_model,expected",
-    [
-        (
-            "test-dataset",
-            Records(),
-            Count(),
-            {"datasetId": "test-dataset", "filters": {}, "return": {"type": "count"}},
-        ),
-        (
-            "test-dataset",
-            Count(),
-            Count(groupby=GroupBy("uniqueId")),
-            {
-                "datasetId": "test-dataset",
-                "filters": {},
-                "return": {"type": "count", "groupBy": {"type": "uniqueId"}},
-            },
-        ),
-        (
-            "test-dataset",
-            Count(),
-            Records(),
-            {"datasetId": "test-dataset", "filters": {}, "return": {"type": "records"}},
-        ),
-    ],
-)
-def test_set_return_model(
-    dataset_id: str,
-    initial_return_model: Records | Count,
-    return_model: Records | Count,
-    expected: dict,
-) -> None:
-    """Test set_return_model build properly."""
-    assert (
-        expected
-        == QueryDocument(dataset_id, initial_return_model)
-        .set_return_model(return_model)
-        .build()
-    )
-
-
-@pytest.mark.parametrize(
-    "dataset_id,return_model,only,expected",
-    [
-        (
-            "test-dataset",
-            Records(),
-            Only("newest"),
-            {
-                "datasetId": "test-dataset",
-                "return": {"type": "records"},
-                "filters": {"only": "newest"},
-            },
-        ),
-        (
-            "test-dataset",
-            Records(),
-            Only("oldest"),
-            {
-                "datasetId": "test-dataset",
-                "return": {"type": "records"},
-                "filters": {"only": "oldest"},
-            },
-        ),
-        (
-            "test-dataset",
-            Records(),
-            "newest",
-            {
-                "datasetId": "test-dataset",
-                "return": {"type": "records"},
-                "filters": {"only": "newest"},
-            },
-        ),
-        (
-            "test-dataset",
-            Records(),
-            "oldest",
-            {
-                "datasetId": "test-dataset",
-                "return": {"type": "records"},
-                "filters": {"only": "oldest"},
-            },
-        ),
-        (
-            "test-dataset",
-            Records(),
-            None,
-            {"datasetId": "test-dataset", "return": {"type": "records"}, "filters": {}},
-        ),
-    ],
-)
-def test_set_only(
-    dataset_id: str, return_model: Records, only: Only | None, expected: dict
-) -> None:
-    """Test set_only builds properly."""
-    assert expected == QueryDocument(dataset_id, return_model).set_only(only).build()
-
-
-@pytest.mark.parametrize(
-    "dataset_id,return_model,uids,expected",
-    [
-        (
-            "test-dataset",
-            Records(),
-            ["aaa"],
-            {
-                "datasetId": "test-dataset",
-                "return": {"type": "records"},
-                "filters": {"id": ["aaa"]},
-            },
-        ),
-        (
-            "test-dataset",
-            Records(),
-            None,
-            {"datasetId": "test-dataset", "return": {"type": "records"}, "filters": {}},
-        ),
-    ],
-)
-def test_set_uids(
-    dataset_id: str, return_model: Records, uids: list[str | int] | None, expected: dict
-) -> None:
-    """Test set_uids builds properly."""
-    assert expected == QueryDocument(dataset_id, return_model).set_uids(uids).build()
-
-
-@pytest.mark.parametrize(
-    "dataset_id,return_model,time_range,expected",
-    [
-        (
-            "test-dataset",
-            Records(),
-            TimeRange().from_strings(
-                "2020-01-01T00:00:00+00:00", "2020-01-01T00:00:01+00:00"
-            ),
-            {
-                "datasetId": "test-dataset",
-                "return": {"type": "records"},
-                "filters": {
-                    "time": {
-                        "minTime": "2020-01-01T00:00:00+00:00",
-                        "maxTime": "2020-01-01T00:00:01+00:00",
-                    }
-                },
-            },
-        ),
-        (
-            "test-dataset",
-            Records(),
-            None,
-            {"datasetId": "test-dataset", "return": {"type": "records"}, "filters": {}},
-        ),
-    ],
-)
-def test_set_time_range(
-    dataset_id: str, return_model: Records, time_range: TimeRange | None, expected: dict
-) -> None:
-    """Test set_time_range builds properly."""
-    assert (
-        expected
-        == QueryDocument(dataset_id, return_model).set_time_range(time_range).build()
-    )
+def _expected(filters: dict | None = None, return_model: dict | None = None, dataset_id: str = "test-dataset") -> dict:
+    """Return the document a Records QueryDocument on `dataset_id` builds with the given filters."""
+    return {
+        "datasetId": dataset_id,
+        "filters": filters or {},
+        "return": return_model or {"type": "records"},
+    }
+
+
+_POLY_COORDS = ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.0, 0.0))
+_FF_OUTSIDE_FILTER = {"fields": {"delta distance": {"outside": [-22, 0]}}}
+
+_BUILDER_CASES = [
+    # set_dataset_id
+    pytest.param("set_dataset_id", "test-dataset-2", _expected(dataset_id="test-dataset-2"), id="dataset_id"),
+    # set_only
+    pytest.param("set_only", Only("newest"), _expected({"only": "newest"}), id="only newest"),
+    pytest.param("set_only", Only("oldest"), _expected({"only": "oldest"}), id="only oldest"),
+    pytest.param("set_only", "newest", _expected({"only": "newest"}), id="only newest str"),
+    pytest.param("set_only", "oldest", _expected({"only": "oldest"}), id="only oldest str"),
+    pytest.param("set_only", None, _expected(), id="only None"),
+    # set_uids
+    pytest.param("set_uids", ["aaa"], _expected({"id": ["aaa"]}), id="uids"),
+    pytest.param("set_uids", None, _expected(), id="uids None"),
+    # set_time_range
+    pytest.param(
+        "set_time_range",
+        _TIME,
+        _expected({"time": {"minTime": "2020-01-01T00:00:00+00:00", "maxTime": "2020-01-01T00:00:01+00:00"}}),
+        id="time_range",
+    ),
+    pytest.param("set_time_range", None, _expected(), id="time_range None"),
+    # set_geometry
+    pytest.param(
+        "set_geometry", _POLY, _expected({"geo": {"type": "Polygon", "coordinates": _POLY_COORDS}}), id="polygon"
+    ),
+    pytest.param(
+        "set_geometry",
+        BBox().from_corners(0.0, 0.0, 1.0, 1.0),
+        _expected({"geo": {"type": "BoundingBox", "bounds": (0.0, 0.0, 1.0, 1.0)}}),
+        id="bbox",
+    ),
+    pytest.param("set_geometry", None, _expected(), id="geometry None"),
+    # set_filter_field / set_filter_fields
+    pytest.param("set_filter_field", _FF_OUTSIDE, _expected(_FF_OUTSIDE_FILTER), id="filter_field"),
+    pytest.param("set_filter_fields", [_FF_OUTSIDE], _expected(_FF_OUTSIDE_FILTER), id="single field"),
+    pytest.param(
+        "set_filter_fields",
+        _FFS_SAME_NAME,
+        _expected({"fields": {"delta distance": {"between": [-22, 0]}}}),
+        id="new field with same name overwrites existing field",
+    ),
+    pytest.param("set_filter_fields", None, _expected(), id="None deletes all fields"),
+]
+
+
+@pytest.mark.parametrize("method,arg,expected", _BUILDER_CASES)
+def test_builder_roundtrip(qd: QueryDocument, method: str, arg: Any, expected: dict) -> None:
+    """Test each QueryDocument setter builds properly."""
+    assert expected == getattr(qd, method)(arg).build()
 
 
 @pytest.mark.parametrize(
-    "dataset_id,return_model,geometry,expected",
-    [
-        (
-            "test-dataset",
-            Records(),
-            Polygon().from_raw_coords(
-                [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.0, 0.0)]
-            ),
-            {
-                "datasetId": "test-dataset",
-                "filters": {
-                    "geo": {
-                        "type": "Polygon",
-                        "coordinates": (
-                            (0.0, 0.0),
-                            (1.0, 0.0),
-                            (1.0, 1.0),
-                            (0.0, 1.0),
-                            (0.0, 0.0),
-                        ),
-                    }
-                },
-                "return": {"type": "records"},
-            },
-        ),
-        (
-            "test-dataset",
-            Records(),
-            BBox().from_corners(0.0, 0.0, 1.0, 1.0),
-            {
-                "datasetId": "test-dataset",
-                "filters": {
-                    "geo": {"type": "BoundingBox", "bounds": (0.0, 0.0, 1.0, 1.0)}
-                },
-                "return": {"type": "records"},
-            },
-        ),
-        (
-            "test-dataset",
-            Records(),
-            None,
-            {"datasetId": "test-dataset", "return": {"type": "records"}, "filters": {}},
-        ),
-    ],
-)
-def test_set_geometry(
-    dataset_id: str,
-    return_model: Records,
-    geometry: Polygon | BBox | None,
-    expected: dict,
-) -> None:
-    """Test set_geometry builds properly."""
-    assert (
-        expected
-        == QueryDocument(dataset_id, return_model).set_geometry(geometry).build()
-    )
-
-
-@pytest.mark.parametrize(
-    "dataset_id,return_model,filter_field,expected",
-    [
-        (
-            "test-dataset",
-            Records(),
-            FilterField(
-                name="delta distance",
-                field_type=FieldType("signed number"),
-                value=[-22, 0],
-                operation=FilterOperator("outside"),
-                schema={
-                    "absolute distance": {"type": "number", "signed": False},
-                    "delta distance": {"type": "number", "signed": True},
-                },
-            ),
-            {
-                "datasetId": "test-dataset",
-                "return": {"type": "records"},
-                "filters": {"fields": {"delta distance": {"outside": [-22, 0]}}},
-            },
-        ),
-    ],
-)
-def test_set_filter_field(
-    dataset_id: str, return_model: Records, filter_field: FilterField, expected: dict
-) -> None:
-    """Test set_filter_field builds properly."""
-    assert (
-        expected
-        == QueryDocument(dataset_id, return_model)
-        .set_filter_field(filter_field)
-        .build()
-    )
-
-
-@pytest.mark.parametrize(
-    "dataset_id,return_model,filter_fields,expected",
+    "initial,return_model,expected",
     [
+        pytest.param(_RECORDS, _COUNT, _expected(return_model={"type": "count"}), id="records to count"),
         pytest.param(
-            "test-dataset",
-            Records(),
-            [
-                FilterField(
-                    name="delta distance",
-                    field_type=FieldType("signed number"),
-                    value=[-22, 0],
-                    operation=FilterOperator("outside"),
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                    },
-                ),
-            ],
-            {
-                "datasetId": "test-dataset",
-                "return": {"type": "records"},
-                "filters": {"fields": {"delta distance": {"outside": [-22, 0]}}},
-            },
-            id="single field",
+            _RECORDS,
+            _COUNT_BY_UID,
+            _expected(return_model={"type": "count", "groupBy": {"type": "uniqueId"}}),
+            id="records to count by uniqueId",
         ),
         pytest.param(
-            "test-dataset",
-            Records(),
-            [
-                FilterField(
-                    name="delta distance",
-                    field_type=FieldType("signed number"),
-                    value=[-22, 0],
-                    operation=FilterOperator("outside"),
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                    },
-                ),
-                FilterField(
-                    name="delta distance",
-                    field_type=FieldType("signed number"),
-                    value=[-22, 0],
-                    operation=FilterOperator("between"),
-                    schema={
-                        "absolute distance": {"type": "number", "signed": False},
-                        "delta distance": {"type": "number", "signed": True},
-                    },
-                ),
-            ],
-            {
-                "datasetId": "test-dataset",
-                "return": {"type": "records"},
-                "filters": {"fields": {"delta distance": {"between": [-22, 0]}}},
-            },
-            id="new field with same name overwrites existing field",
-        ),
-        pytest.param(
-            "test-dataset",
-            Records(),
-            None,
-            {"datasetId": "test-dataset", "return": {"type": "records"}, "filters": {}},
-            id="None deletes all fields",
+            _COUNT,
+            _COUNT_BY_UID,
+            _expected(return_model={"type": "count", "groupBy": {"type": "uniqueId"}}),
+            id="count to count by uniqueId",
         ),
+        pytest.param(_COUNT, _RECORDS, _expected(), id="count to records"),
     ],
 )
-def test_set_filter_fields(
-    dataset_id: str,
-    return_model: Records,
-    filter_fields: list[FilterField] | None,
+def test_set_return_model(
+    qd: QueryDocument,
+    initial: Records | Count,
+    return_model: Records | Count,
     expected: dict,
 ) -> None:
-    """Test set_filter_field builds properly."""
-    assert (
-        expected
-        == QueryDocument(dataset_id, return_model)
-        .set_filter_fields(filter_fields)
-        .build()
-    )
+    """Test set_return_model builds properly when replacing a different return model."""
+    assert expected == qd.set_return_model(initial).set_return_model(return_model).build()
@@ -1,10 +1,41 @@
 """Configuration for receive test fixtures."""
 
+import json
+from typing import Any
+
 import pytest
 
 from dfi import Client
+from dfi.services._sse import SSEStream
 
 
-@pytest.fixture(name="dfi", scope="module")
+@pytest.fixture(name="dfi", scope="session")
 def get_dfi_client() -> Client:
     return Client("token", "www.test.com")
+
+
+@pytest.fixture(name="sse_payloads", scope="module")
+def get_sse_payloads() -> dict[str, list[tuple[str | None, Any]]]:
+    return {
+        "finish_empty": [("finish", {"messageCount": 0})],
+        "single": [("message", 1), ("finish", {"messageCount": 1})],
+        "multi": [(None, 1), (None, 4), ("finish", {"messageCount": 2})],
+    }
+
+
+@pytest.fixture(name="client")
+def get_sse_client(request: pytest.FixtureRequest) -> SSEStream:
+    """Build a single-chunk stream from indirectly parametrized (event, data) pairs.
+
+    The param may instead name a scenario in `sse_payloads`.  Data is serialized to JSON; an event of
+    None is sent without an event line.
+    """
+    events = request.param
+    if isinstance(events, str):
+        events = request.getfixturevalue("sse_payloads")[events]
+    frames = []
+    for event, data in events:
+        if event is not None:
+            frames.append(b"event: " + event.encode() + b"\n")
+        frames.append(b"data: " + json.dumps(data).encode() + b"\n\n")
+    return SSEStream([b"".join(frames)])
@@ -1,12 +1,8 @@
-"""Tests for _receive_counts, receive_ids, and receive_records."""
+"""Tests for _receive_counts."""
 
 # mypy: disable-error-code="arg-type"
 
-import logging
-
 import pytest
-from _pytest.python_api import RaisesContext
-from sseclient import SSEClient
 
 from dfi import Client
 from dfi.errors import (
@@ -16,71 +12,54 @@ from dfi.errors import (
     NoFinishMessageReceivedError,
     UnkownMessageReceivedError,
 )
-
-_logger = logging.getLogger(__name__)
+from dfi.services._sse import SSEStream
 
 
 #########################
 # Error Conditions
 #########################
 @pytest.mark.parametrize(
-    "client,expectation",
+    "client,exc_type",
     [
-        pytest.param(
-            SSEClient([b"event: unknown_event\nmessageCount: 1\ndata: 1\n\n"]),
-            pytest.raises(UnkownMessageReceivedError),
-            id="UnkownMessageReceivedError",
-        ),
-        pytest.param(SSEClient([]), pytest.raises(NoEventsRecievedError), id="NoEventsRecievedError"),
-        pytest.param(
-            SSEClient([b"messageCount: 1\ndata: 1\n\n"]),
-            pytest.raises(NoFinishMessageReceivedError),
-            id="NoFinishMessageReceivedError",
-        ),
-        pytest.param(
-            SSEClient([b'event: finish\ndata: {"messageCount": 2}\n\n']),
-            pytest.raises(EventsMissedError),
-            id="EventsMissedError",
-        ),
-        pytest.param(
-            SSEClient([b"event: queryError\nmessageCount: 1\ndata: {'error': 'test error'}\n\n"]),
-            pytest.raises(DFIResponseError),
-            id="DFIResponseError",
-        ),
+        pytest.param([("unknown_event", 1)], UnkownMessageReceivedError, id="UnkownMessageReceivedError"),
+        pytest.param([(None, 1)], NoFinishMessageReceivedError, id="NoFinishMessageReceivedError"),
+        pytest.param([("finish", {"messageCount": 2})], EventsMissedError, id="EventsMissedError"),
+        pytest.param([("queryError", {"error": "test error"})], DFIResponseError, id="DFIResponseError"),
     ],
+    indirect=["client"],
 )
 def test_receive_counts_error_conditions(
     dfi: Client,
-    client: SSEClient,
-    expectation: RaisesContext,
+    client: SSEStream,
+    exc_type: type[Exception],
 ) -> None:
     """Test _receive_counts errors are raised."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = dfi.query._receive_counts(client)
 
 
+@pytest.mark.parametrize("client", [pytest.param([], id="empty stream")], indirect=True)
+def test_receive_counts_empty(dfi: Client, client: SSEStream) -> None:
+    """Test NoEventsRecievedError is raised when the stream is empty."""
+    with pytest.raises(NoEventsRecievedError):
+        dfi.query._receive_counts(client)
+
+
 #########################
 # Normal Conditions
 #########################
 @pytest.mark.parametrize(
     "client,expected",
     [
-        pytest.param(SSEClient([b'event: finish\ndata: {"messageCount": 0}\n\n']), 0, id="finish with no messages"),
-        pytest.param(
-            SSEClient([b"event: message\ndata: 1\n\n", b'event: finish\ndata: {"messageCount": 1}\n\n']),
-            1,
-            id="one message event",
-        ),
-        pytest.param(
-            SSEClient([b"data: 1\n\n", b"data: 4\n\n", b'event: finish\ndata: {"messageCount": 2}\n\n']),
-            5,
-            id="multiple events sum",
-        ),
+        pytest.param("finish_empty", 0, id="finish with no messages"),
+        pytest.param("single", 1, id="one message event"),
+        pytest.param("multi", 5, id="multiple events sum"),
     ],
+    indirect=["client"],
 )
 def test_receive_counts(
     dfi: Client,
-    client: SSEClient,
+    client: SSEStream,
     expected: int,
 ) -> None:
     """Test _receive_counts works as intended."""
@@ -1,11 +1,8 @@
 """Tests for _receive_unique_id_counts."""
 
 # mypy: disable-error-code="arg-type"
-import logging
 
 import pytest
-from _pytest.python_api import RaisesContext
-from sseclient import SSEClient
 
 from dfi import Client
 from dfi.errors import (
@@ -15,46 +12,46 @@ from dfi.errors import (
     NoFinishMessageReceivedError,
     UnkownMessageReceivedError,
 )
-
-_logger = logging.getLogger(__name__)
+from dfi.services._sse import SSEStream
 
 
 #########################
 # Error Conditions
 #########################
 @pytest.mark.parametrize(
-    "client,expectation",
+    "client,exc_type",
     [
         pytest.param(
-            SSEClient([b'event: unknown_event\nmessageCount: 1\ndata: [["aaa", 1]]\n\n']),
-            pytest.raises(UnkownMessageReceivedError),
+            [("unknown_event", [["aaa", 1]])],
+            UnkownMessageReceivedError,
             id="UnkownMessageReceivedError",
         ),
-        pytest.param(SSEClient([]), pytest.raises(NoEventsRecievedError), id="NoEventsRecievedError"),
+        pytest.param([], NoEventsRecievedError, id="NoEventsRecievedError"),
         pytest.param(
-            SSEClient([b'messageCount: 1\ndata: [["aaa", 1]]\n\n']),
-            pytest.raises(NoFinishMessageReceivedError),
+            [(None, [["aaa", 1]])],
+            NoFinishMessageReceivedError,
             id="NoFinishMessageReceivedError",
         ),
         pytest.param(
-            SSEClient([b'event: finish\ndata: {"messageCount": 2}\n\n']),
-            pytest.raises(EventsMissedError),
+            [("finish", {"messageCount": 2})],
+            EventsMissedError,
             id="EventsMissedError",
         ),
         pytest.param(
-            SSEClient([b'event: queryError\nmessageCount: 1\ndata: {"error": "test error"}\n\n']),
-            pytest.raises(DFIResponseError),
+            [("queryError", {"error": "test error"})],
+            DFIResponseError,
             id="DFIResponseError",
         ),
     ],
+    indirect=["client"],
 )
 def test_receive_unique_id_counts_error_conditions(
     dfi: Client,
-    client: SSEClient,
-    expectation: RaisesContext,
+    client: SSEStream,
+    exc_type: type[Exception],
 ) -> None:
     """Test _receive_ids errors are raised."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = dfi.query._receive_unique_id_counts(client)
 
 
@@ -64,28 +61,23 @@ def test_receive_unique_id_counts_error_conditions(
 @pytest.mark.parametrize(
     "client,expected",
     [
-        pytest.param(SSEClient([b'event: finish\ndata: {"messageCount": 0}\n\n']), {}, id="finish with no messages"),
+        pytest.param([("finish", {"messageCount": 0})], {}, id="finish with no messages"),
         pytest.param(
-            SSEClient([b'event: message\ndata: [["aaa", 1]]\n\n', b'event: finish\ndata: {"messageCount": 1}\n\n']),
+            [("message", [["aaa", 1]]), ("finish", {"messageCount": 1})],
             {"aaa": 1},
             id="one message event",
         ),
         pytest.param(
-            SSEClient(
-                [
-                    b'data: [["aaa", 1]]\n\n',
-                    b'data: [["bbb", 2], ["ccc", 3]]\n\n',
-                    b'event: finish\ndata: {"messageCount": 2}\n\n',
-                ]
-            ),
+            [(None, [["aaa", 1]]), (None, [["bbb", 2], ["ccc", 3]]), ("finish", {"messageCount": 2})],
             {"aaa": 1, "bbb": 2, "ccc": 3},
             id="multiple events sum",
         ),
     ],
+    indirect=["client"],
 )
 def test_receive_unique_id_counts(
     dfi: Client,
-    client: SSEClient,
+    client: SSEStream,
     expected: dict[str, int],
 ) -> None:
     """Test _receive_ids works as intended."""
@@ -2,69 +2,83 @@
 
 # mypy: disable-error-code="arg-type"
 
-import logging
+
+import io
+import json
+from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 import pytest
-from _pytest.python_api import RaisesContext
-from sseclient import SSEClient
+import requests
 
 from dfi import Client
 from dfi.errors import (
     DFIResponseError,
     EventsMissedError,
+    InvalidQueryDocument,
     NoEventsRecievedError,
     NoFinishMessageReceivedError,
     UnkownMessageReceivedError,
 )
+from dfi.services._sse import SSEStream
+
+_RECORD_AAA = {"id": "aaa", "coordinate": [0.0, 0.0], "time": "2020-01-01T00:00:00.000Z"}
+_RECORD_BBB = {"id": "bbb", "coordinate": [0.0, 0.0], "time": "2020-01-01T00:00:00.000Z"}
+_RECORD_CCC = {"id": "ccc", "coordinate": [0.0, 0.0], "time": "2020-01-01T00:00:00.000Z"}
+
 
-_logger = logging.getLogger(__name__)
+def _expected(
+    ids: list[Any], times: list[str | None], id_dtype: Any = "string[pyarrow]", **extra: list[Any]
+) -> pd.DataFrame:
+    """Build the records DataFrame expected for points at the origin."""
+    return pd.DataFrame(
+        {
+            "id": pd.array(ids, dtype=id_dtype),
+            "coordinate": pd.array([[0.0, 0.0]] * len(ids), dtype=pd.ArrowDtype(pa.list_(pa.float64()))),
+            "time": pd.to_datetime(times, utc=True),
+            **extra,
+        }
+    )
 
 
 #########################
 # Error Conditions
 #########################
 @pytest.mark.parametrize(
-    "client,expectation",
+    "client,exc_type",
     [
         pytest.param(
-            SSEClient(
-                [
-                    b'event: unknown_event\nmessageCount: 1\ndata: {"id": "aaa", "coordinate": [0.0, 0.0], "time": "2020-01-01T00:00:00.000Z"}\n\n'
-                ]
-            ),
-            pytest.raises(UnkownMessageReceivedError),
+            [("unknown_event", _RECORD_AAA)],
+            UnkownMessageReceivedError,
             id="UnkownMessageReceivedError",
         ),
-        pytest.param(SSEClient([]), pytest.raises(NoEventsRecievedError), id="NoEventsRecievedError"),
+        pytest.param([], NoEventsRecievedError, id="NoEventsRecievedError"),
         pytest.param(
-            SSEClient(
-                [
-                    b'messageCount: 1\ndata: {"id": "aaa", "coordinate": [0.0, 0.0], "time": "2020-01-01T00:00:00.000Z"}\n\n'
-                ]
-            ),
-            pytest.raises(NoFinishMessageReceivedError),
+            [(None, [_RECORD_AAA])],
+            NoFinishMessageReceivedError,
             id="NoFinishMessageReceivedError",
         ),
         pytest.param(
-            SSEClient([b'event: finish\ndata: {"messageCount": 2}\n\n']),
-            pytest.raises(EventsMissedError),
-            id="NoFinishMessageReceivedError",
+            [("finish", {"messageCount": 2})],
+            EventsMissedError,
+            id="EventsMissedError",
         ),
         pytest.param(
-            SSEClient([b'event: queryError\nmessageCount: 1\ndata: {"error": "test error"}\n\n']),
-            pytest.raises(DFIResponseError),
+            [("queryError", {"error": "test error"})],
+            DFIResponseError,
             id="DFIResponseError",
         ),
     ],
+    indirect=["client"],
 )
 def test_receive_records_error_conditions(
     dfi: Client,
-    client: SSEClient,
-    expectation: RaisesContext,
+    client: SSEStream,
+    exc_type: type[Exception],
 ) -> None:
     """Test _receive_points errors are raised."""
-    with expectation:
+    with pytest.raises(exc_type):
         _ = dfi.query._receive_records(client)
 
 
@@ -74,49 +88,158 @@ def test_receive_records_error_conditions(
 @pytest.mark.parametrize(
     "client,expected",
     [
+        pytest.param([("finish", {"messageCount": 0})], _expected([], []), id="finish with no messages"),
         pytest.param(
-            SSEClient([b'event: finish\ndata: {"messageCount": 0}\n\n']),
-            pd.DataFrame(columns=["id", "coordinate", "time"]),
-            id="finish with no messages",
-        ),
-        pytest.param(
-            SSEClient([b"event: message\ndata: []\n\n", b'event: finish\ndata: {"messageCount": 1}\n\n']),
-            pd.DataFrame(columns=["id", "coordinate", "time"]),
+            [("message", []), ("finish", {"messageCount": 1})],
+            _expected([], []),
             id="one message event with no data",
         ),
         pytest.param(
-            SSEClient(
-                [
-                    b'event: message\ndata: [{"id": "aaa", "coordinate": [0.0, 0.0], "time": "2020-01-01T00:00:00.000Z"}]\n\n',
-                    b'event: finish\ndata: {"messageCount": 1}\n\n',
-                ]
-            ),
-            pd.DataFrame([{"id": "aaa", "coordinate": [0.0, 0.0], "time": pd.to_datetime("2020-01-01T00:00:00.000Z")}]),
+            [("message", [_RECORD_AAA]), ("finish", {"messageCount": 1})],
+            _expected(["aaa"], ["2020-01-01T00:00:00.000Z"]),
             id="one message event",
         ),
         pytest.param(
-            SSEClient(
-                [
-                    b'data: [{"id": "aaa", "coordinate": [0.0, 0.0], "time": "2020-01-01T00:00:00.000Z"}]\n\n',
-                    b'data: [{"id": "bbb", "coordinate": [0.0, 0.0], "time": "2020-01-01T00:00:00.000Z"}]\n\n',
-                    b'event: finish\ndata: {"messageCount": 2}\n\n',
-                ]
-            ),
-            pd.DataFrame(
-                [
-                    {"id": "aaa", "coordinate": [0.0, 0.0], "time": pd.to_datetime("2020-01-01T00:00:00.000Z")},
-                    {"id": "bbb", "coordinate": [0.0, 0.0], "time": pd.to_datetime("2020-01-01T00:00:00.000Z")},
-                ]
-            ),
+            [(None, [_RECORD_AAA]), (None, [_RECORD_BBB]), ("finish", {"messageCount": 2})],
+            _expected(["aaa", "bbb"], ["2020-01-01T00:00:00.000Z"] * 2),
             id="multiple events sum",
         ),
+        pytest.param(
+            [(None, [_RECORD_AAA]), (None, [{**_RECORD_BBB, "metadataId": 1}]), ("finish", {"messageCount": 2})],
+            _expected(["aaa", "bbb"], ["2020-01-01T00:00:00.000Z"] * 2, metadataId=[None, 1]),
+            id="missing fields are filled with None",
+        ),
+        pytest.param(
+            [
+                (
+                    None,
+                    [
+                        {**_RECORD_AAA, "time": "2020-01-01T00:00:00.123Z"},
+                        {**_RECORD_BBB, "time": "2020-01-01T01:00:00.000+01:00"},
+                    ],
+                ),
+                ("finish", {"messageCount": 1}),
+            ],
+            _expected(["aaa", "bbb"], ["2020-01-01T00:00:00.123Z", "2020-01-01T00:00:00.000Z"]),
+            id="times with offsets are converted to UTC",
+        ),
+        pytest.param(
+            [(None, [_RECORD_AAA, {"id": "bbb", "coordinate": [0.0, 0.0]}]), ("finish", {"messageCount": 1})],
+            _expected(["aaa", "bbb"], ["2020-01-01T00:00:00.000Z", None]),
+            id="missing times are NaT",
+        ),
+        pytest.param(
+            [(None, [{**_RECORD_AAA, "id": 1}, {**_RECORD_BBB, "id": 2}]), ("finish", {"messageCount": 1})],
+            _expected([1, 2], ["2020-01-01T00:00:00.000Z"] * 2, id_dtype="int64[pyarrow]"),
+            id="integer ids keep their type",
+        ),
+        pytest.param(
+            [(None, [_RECORD_AAA, {**_RECORD_BBB, "id": 2}]), ("finish", {"messageCount": 1})],
+            _expected(["aaa", 2], ["2020-01-01T00:00:00.000Z"] * 2, id_dtype=object),
+            id="mixed ids are objects",
+        ),
+        pytest.param(
+            [(None, [{**_RECORD_AAA, "id": 2**63}]), ("finish", {"messageCount": 1})],
+            _expected([2**63], ["2020-01-01T00:00:00.000Z"], id_dtype="uint64"),
+            id="ids beyond int64 are uint64",
+        ),
     ],
+    indirect=["client"],
 )
 def test_receive_records(
     dfi: Client,
-    client: SSEClient,
+    client: SSEStream,
     expected: pd.DataFrame,
 ) -> None:
     """Test _receive_records works as intended."""
     points = dfi.query._receive_records(client)
     pd.testing.assert_frame_equal(points, expected)
+
+
+_THREE_RECORDS = [(None, [_RECORD_AAA, _RECORD_BBB]), (None, [_RECORD_CCC]), ("finish", {"messageCount": 2})]
+
+
+@pytest.mark.parametrize(
+    "client,chunk_size,expected_ids",
+    [
+        pytest.param(_THREE_RECORDS, None, [["aaa", "bbb", "ccc"]], id="no chunk size"),
+        pytest.param(_THREE_RECORDS, 1, [["aaa"], ["bbb"], ["ccc"]], id="one record per chunk"),
+        pytest.param(_THREE_RECORDS, 2, [["aaa", "bbb"], ["ccc"]], id="chunks span messages"),
+        pytest.param(_THREE_RECORDS, 3, [["aaa", "bbb", "ccc"]], id="exact chunk"),
+        pytest.param([("finish", {"messageCount": 0})], 2, [], id="no records"),
+    ],
+    indirect=["client"],
+)
+def test_receive_records_chunked(
+    dfi: Client,
+    client: SSEStream,
+    chunk_size: int | None,
+    expected_ids: list[list[str]],
+) -> None:
+    """Test _receive_records_chunked yields DataFrames of at most chunk_size records."""
+    chunks = list(dfi.query._receive_records_chunked(client, chunk_size=chunk_size))
+    assert len(chunks) == len(expected_ids)
+    for chunk, ids in zip(chunks, expected_ids, strict=True):
+        pd.testing.assert_frame_equal(chunk, _expected(ids, ["2020-01-01T00:00:00.000Z"] * len(ids)))
+
+
+@pytest.mark.parametrize(
+    "client",
+    [[(None, [_RECORD_AAA, {"id": "bbb", "coordinate": [0.0, 0.0]}]), ("finish", {"messageCount": 1})]],
+    indirect=True,
+)
+def test_receive_records_chunked_missing_time(dfi: Client, client: SSEStream) -> None:
+    """Test a chunk in which no record has a time still has a time column, of NaT."""
+    chunks = list(dfi.query._receive_records_chunked(client, chunk_size=1))
+    expected = [_expected(["aaa"], ["2020-01-01T00:00:00.000Z"]), _expected(["bbb"], [None])]
+    assert len(chunks) == len(expected)
+    for chunk, frame in zip(chunks, expected, strict=True):
+        pd.testing.assert_frame_equal(chunk, frame)
+
+
+@pytest.mark.parametrize("client", [_THREE_RECORDS], indirect=True)
+def test_receive_records_chunked_invalid_chunk_size(dfi: Client, client: SSEStream) -> None:
+    """Test _receive_records_chunked rejects a chunk_size below 1."""
+    with pytest.raises(ValueError):
+        next(dfi.query._receive_records_chunked(client, chunk_size=0))
+
+
+def test_records_chunked_yields_while_response_is_open(dfi: Client, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test records_chunked yields each chunk before the response is closed."""
+    records = b"".join(f"data: {json.dumps([{**_RECORD_AAA, 'id': uid}])}\n\n".encode() for uid in "abc")
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(records + b'event: finish\ndata: {"messageCount": 3}\n\n')
+    monkeypatch.setattr(dfi.query.conn, "api_post", lambda *args, **kwargs: response)
+
+    chunks = dfi.query.records_chunked("test-dataset", chunk_size=2)
+    first = next(chunks)
+    assert not response.raw.closed
+
+    rest = list(chunks)
+    assert response.raw.closed
+    assert [["a", "b"], ["c"]] == [chunk["id"].tolist() for chunk in [first, *rest]]
+
+
+@pytest.mark.parametrize(
+    "dataset_id,chunk_size,exc_type",
+    [
+        pytest.param(None, 1, InvalidQueryDocument, id="InvalidQueryDocument"),
+        pytest.param("test-dataset", 0, ValueError, id="ValueError"),
+    ],
+)
+def test_records_chunked_validates_when_called(
+    dfi: Client,
+    monkeypatch: pytest.MonkeyPatch,
+    dataset_id: str,
+    chunk_size: int,
+    exc_type: type[Exception],
+) -> None:
+    """Test records_chunked rejects invalid arguments when called, before any request is sent."""
+
+    def api_post(*args: Any, **kwargs: Any) -> requests.Response:
+        raise AssertionError("no request should be sent")
+
+    monkeypatch.setattr(dfi.query.conn, "api_post", api_post)
+    with pytest.raises(exc_type):
+        dfi.query.records_chunked(dataset_id, chunk_size=chunk_size)
@@ -0,0 +1,50 @@
+"""Tests for the incremental Server-Sent Event decoder."""
+
+import pytest
+
+from dfi.services._sse import Event, SSEStream
+
+_PAYLOAD = b'event: message\ndata: [["aaa", 1]]\n\n: keep alive\n\nevent: finish\ndata: {"messageCount": 1}\n\n'
+_EXPECTED = [
+    Event(event="message", data='[["aaa", 1]]'),
+    Event(event="finish", data='{"messageCount": 1}'),
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, len(_PAYLOAD)])
+def test_events_independent_of_chunking(chunk_size: int) -> None:
+    """Test the same events are decoded however the stream is chunked."""
+    chunks = [_PAYLOAD[i : i + chunk_size] for i in range(0, len(_PAYLOAD), chunk_size)]
+    assert list(SSEStream(chunks).events()) == _EXPECTED
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        pytest.param([_PAYLOAD.replace(b"\n", b"\r\n")], id="CRLF"),
+        pytest.param([_PAYLOAD.replace(b"\n", b"\r")], id="CR"),
+        pytest.param([_PAYLOAD.replace(b"\n", b"\r\n")[:15], _PAYLOAD.replace(b"\n", b"\r\n")[15:]], id="split CRLF"),
+    ],
+)
+def test_events_line_endings(chunks: list[bytes]) -> None:
+    """Test CR and CRLF line endings decode like LF."""
+    assert list(SSEStream(chunks).events()) == _EXPECTED
+
+
+@pytest.mark.parametrize(
+    "chunks,expected",
+    [
+        pytest.param([b"data: 1\n\n"], [Event(data="1")], id="event defaults to message"),
+        pytest.param([b"data: a\ndata: b\n\n"], [Event(data="a\nb")], id="multi-line data"),
+        pytest.param(
+            [b"event: unknown\nmessageCount: 1\ndata:1\n\n"], [Event(event="unknown", data="1")], id="unknown field"
+        ),
+        pytest.param([b"id: 7\nretry: 10\ndata: 1\n\n"], [Event(data="1", id="7", retry="10")], id="id and retry"),
+        pytest.param([b"event: finish\n\n"], [], id="no data is not dispatched"),
+        pytest.param([b"data: 1"], [Event(data="1")], id="unterminated trailing event"),
+        pytest.param([], [], id="empty stream"),
+    ],
+)
+def test_events(chunks: list[bytes], expected: list[Event]) -> None:
+    """Test SSE fields are decoded."""
+    assert expected == list(SSEStream(chunks).events())
@@ -86,3 +86,28 @@ def test_csv_format_builder() -> None:
     }
 
     assert csv_format == expected
+
+
+def test_builders_hash_by_identity() -> None:
+    credentials = AWSCredentials("arn:aws:s3:::example_bucket/example_key", policy={"Version": "2012-10-17"})
+    batch_url_files = BatchURLFiles(["www.example-0.com"])
+
+    assert {credentials, batch_url_files} == {credentials, batch_url_files}
+    assert credentials != AWSCredentials("arn:aws:s3:::example_bucket/example_key", policy={"Version": "2012-10-17"})
+
+
+def test_csv_format_builder_optional_columns() -> None:
+    csv_format = CSVFormat(entity_id=1, timestamp=2, longitude=3, latitude=4, altitude=0, metadata_id=5).build()
+
+    expected = {
+        "csv": {
+            "entityId": 1,
+            "timestamp": 2,
+            "longitude": 3,
+            "latitude": 4,
+            "altitude": 0,
+            "metadataId": 5,
+        }
+    }
+
+    assert csv_format == expected
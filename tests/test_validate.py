@@ -0,0 +1,46 @@
+"""Tests for response validation."""
+
+import logging
+
+import pytest
+import requests
+
+from dfi import validate
+from dfi.errors import DFIResponseError
+
+
+class _Response(requests.models.Response):
+    """A response that records whether its body was read."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__()
+        self.status_code = status_code
+        self.body_read = False
+
+    @property
+    def text(self) -> str:
+        self.body_read = True
+        return "body"
+
+
+def test_response_success_does_not_read_body(caplog: pytest.LogCaptureFixture) -> None:
+    """Test a successful response is not read when debug logging is off."""
+    caplog.set_level(logging.INFO, logger="dfi.validate")
+    resp = _Response(200)
+    validate.response(resp, "www.test.com", {"Authorization": "Bearer token"}, payload={"a": 1})
+    assert not resp.body_read
+
+
+def test_response_success_debug_reads_body(caplog: pytest.LogCaptureFixture) -> None:
+    """Test a successful response is logged when debug logging is on."""
+    resp = _Response(200)
+    with caplog.at_level(logging.DEBUG, logger="dfi.validate"):
+        validate.response(resp, "www.test.com", {"Authorization": "Bearer token"}, payload={"a": 1})
+    assert resp.body_read
+    assert "Bearer XXX" in caplog.text
+
+
+def test_response_error_raises() -> None:
+    """Test DFIResponseError is raised for a non 2xx response."""
+    with pytest.raises(DFIResponseError, match="STATUS CODE: 404"):
+        validate.response(_Response(404), "www.test.com", {"Authorization": "Bearer token"})